@@ -0,0 +1,37 @@
+/**
+ * Unit tests for bounded-concurrency mapping
+ */
+
+import { describe, it, expect } from '@jest/globals';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+
+const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+describe('mapWithConcurrency', () => {
+  it('should keep results in input order', async () => {
+    const results = await mapWithConcurrency([30, 10, 20], 3, async (ms) => {
+      await delay(ms);
+      return ms * 2;
+    });
+
+    expect(results).toEqual([60, 20, 40]);
+  });
+
+  it('should never exceed the concurrency limit', async () => {
+    let inFlight = 0;
+    let maxInFlight = 0;
+
+    await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await delay(5);
+      inFlight--;
+    });
+
+    expect(maxInFlight).toBe(3);
+  });
+
+  it('should handle an empty input', async () => {
+    expect(await mapWithConcurrency([], 4, async (x: number) => x)).toEqual([]);
+  });
+});
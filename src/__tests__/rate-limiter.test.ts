@@ -0,0 +1,103 @@
+/**
+ * Unit tests for the token-bucket rate limiter
+ */
+
+import { describe, it, expect, beforeAll, beforeEach, afterEach, jest } from '@jest/globals';
+import type {
+  RateLimiter as RateLimiterClass,
+  RateLimitedError as RateLimitedErrorClass,
+} from '../utils/rate-limiter.js';
+
+let RateLimiter: typeof RateLimiterClass;
+let RateLimitedError: typeof RateLimitedErrorClass;
+
+beforeAll(async () => {
+  // The limiter logs through the app logger, which validates config on import
+  process.env['GOOGLE_OAUTH_CLIENT_ID'] ??= 'test-client-id';
+  process.env['GOOGLE_OAUTH_CLIENT_SECRET'] ??= 'test-client-secret';
+  process.env['SPOTIFY_CLIENT_ID'] ??= 'test-spotify-id';
+  process.env['SPOTIFY_CLIENT_SECRET'] ??= 'test-spotify-secret';
+  process.env['LOG_LEVEL'] ??= 'error';
+  ({ RateLimiter, RateLimitedError } = await import('../utils/rate-limiter.js'));
+});
+
+describe('RateLimiter', () => {
+  beforeEach(() => {
+    jest.useFakeTimers();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('allows a full burst, then reports a wait', () => {
+    const limiter = new RateLimiter('test', { requestsPerMinute: 60, burstLimit: 3 });
+
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBeGreaterThan(0);
+  });
+
+  it('takes nothing on a failed try', () => {
+    const limiter = new RateLimiter('test', { requestsPerMinute: 2, burstLimit: 10 });
+    limiter.tryAcquire();
+    limiter.tryAcquire();
+    const before = limiter.getStats().available;
+
+    expect(limiter.tryAcquire()).toBeGreaterThan(0);
+    expect(limiter.getStats().available).toEqual(before);
+  });
+
+  it('refills tokens as time passes', () => {
+    const limiter = new RateLimiter('test', { requestsPerMinute: 60, burstLimit: 1 });
+    expect(limiter.tryAcquire()).toBe(0);
+    const wait = limiter.tryAcquire();
+    expect(wait).toBeGreaterThan(0);
+
+    jest.advanceTimersByTime(wait);
+    expect(limiter.tryAcquire()).toBe(0);
+  });
+
+  it('waits for the slowest bucket', () => {
+    // Burst refills in 10s, but the minute bucket needs 30s per token
+    const perMinute = new RateLimiter('test', { requestsPerMinute: 2, burstLimit: 10 });
+    perMinute.tryAcquire();
+    perMinute.tryAcquire();
+    const minuteWait = perMinute.tryAcquire();
+    expect(minuteWait).toBeGreaterThanOrEqual(30000);
+    expect(minuteWait).toBeLessThanOrEqual(30001);
+
+    // The hour bucket is exhausted long before the minute bucket
+    const perHour = new RateLimiter('test', { requestsPerMinute: 60, requestsPerHour: 1 });
+    perHour.tryAcquire();
+    expect(perHour.tryAcquire()).toBeGreaterThanOrEqual(3600000);
+  });
+
+  it('acquire waits within maxWaitMs', async () => {
+    // Drain a 10-token burst; the next token refills in 1s
+    const limiter = new RateLimiter('test', { requestsPerMinute: 60, burstLimit: 10 });
+    for (let i = 0; i < 10; i++) {
+      limiter.tryAcquire();
+    }
+
+    let acquired = false;
+    const pending = limiter.acquire(5000).then(() => {
+      acquired = true;
+    });
+    await jest.advanceTimersByTimeAsync(2000);
+    await pending;
+
+    expect(acquired).toBe(true);
+  });
+
+  it('acquire throws RateLimitedError when the wait exceeds maxWaitMs', async () => {
+    const limiter = new RateLimiter('test', { requestsPerMinute: 2, burstLimit: 10 });
+    limiter.tryAcquire();
+    limiter.tryAcquire();
+
+    const error = await limiter.acquire(1000).catch((e: unknown) => e);
+    expect(error).toBeInstanceOf(RateLimitedError);
+    expect((error as RateLimitedErrorClass).retryAfterMs).toBeGreaterThanOrEqual(30000);
+  });
+});
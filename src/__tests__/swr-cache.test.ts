@@ -0,0 +1,41 @@
+/**
+ * Unit tests for the stale-while-revalidate cache
+ */
+
+import { describe, it, expect } from '@jest/globals';
+import { SwrCache } from '../utils/swr-cache.js';
+
+describe('SwrCache', () => {
+  it('serves a loaded value from cache', async () => {
+    const cache = new SwrCache<string[]>(10, 60000, 600000);
+    let loads = 0;
+    const load = async () => {
+      loads++;
+      return ['a'];
+    };
+
+    expect(await cache.get('k', load)).toEqual(['a']);
+    expect(await cache.get('k', load)).toEqual(['a']);
+    expect(loads).toBe(1);
+  });
+
+  it('rejects with the loader error when the first load fails', async () => {
+    const cache = new SwrCache<string[]>(10, 60000, 600000);
+    const failure = new Error('quota exceeded');
+
+    await expect(cache.get('k', async () => {
+      throw failure;
+    })).rejects.toBe(failure);
+
+    // The failure is not cached; the next call loads again
+    expect(await cache.get('k', async () => ['b'])).toEqual(['b']);
+  });
+
+  it('reloads after deletePrefix', async () => {
+    const cache = new SwrCache<string[]>(10, 60000, 600000);
+    await cache.get('user|playlists', async () => ['old']);
+    cache.deletePrefix('user|');
+
+    expect(await cache.get('user|playlists', async () => ['new'])).toEqual(['new']);
+  });
+});
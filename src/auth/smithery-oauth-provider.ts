@@ -1,5 +1,6 @@
 import { ProxyOAuthServerProvider } from '@modelcontextprotocol/sdk/server/auth/providers/proxyProvider.js';
 import type { AuthInfo } from '@modelcontextprotocol/sdk/server/auth/types.js';
+import { InvalidTokenError } from '@modelcontextprotocol/sdk/server/auth/errors.js';
 import type { AuthorizationParams } from '@modelcontextprotocol/sdk/server/auth/provider.js';
 import type { OAuthClientInformationFull } from '@modelcontextprotocol/sdk/shared/auth.js';
 import type { OAuthRegisteredClientsStore } from '@modelcontextprotocol/sdk/server/auth/clients.js';
@@ -7,14 +8,21 @@ import type { OAuthProvider } from '@smithery/sdk';
 import type { Response } from 'express';
 import { config } from '../config.js';
 import { createLogger } from '../utils/logger.js';
+import { secretKey } from '../utils/hash.js';
 import { randomUUID } from 'crypto';
+import { LRUCache } from 'lru-cache';
 
 const logger = createLogger('smithery-oauth');
 
+// Log level is fixed at startup; resolve it once so per-request debug logs on
+// the auth path skip building their metadata objects when filtered out
+const LOG_DEBUG = logger.isDebugEnabled();
+
 // Google OAuth 2.0 endpoints
 const GOOGLE_AUTH_URL = 'https://accounts.google.com/o/oauth2/v2/auth';
 const GOOGLE_TOKEN_URL = 'https://oauth2.googleapis.com/token';
 const GOOGLE_REVOKE_URL = 'https://oauth2.googleapis.com/revoke';
+const GOOGLE_TOKENINFO_URL = 'https://oauth2.googleapis.com/tokeninfo?access_token=';
 
 // OAuth scopes for YouTube Music
 const YOUTUBE_SCOPES = [
@@ -22,8 +30,74 @@ const YOUTUBE_SCOPES = [
   'https://www.googleapis.com/auth/youtube.readonly',
 ];
 
+// Space-delimited form of YOUTUBE_SCOPES, as used in OAuth client metadata
+const YOUTUBE_SCOPE = YOUTUBE_SCOPES.join(' ');
+
+// Our callback endpoint, registered with Google as the redirect_uri.
+// Google redirects here after user authorization and we forward to the client.
+const OUR_REDIRECT_URI = config.googleRedirectUri ||
+  `https://ytmusic.dumawtf.com/oauth/callback`;
+
+// Google credentials swapped over a registered client's own credentials
+// whenever we talk to Google upstream
+const GOOGLE_CREDENTIALS = Object.freeze({
+  client_id: config.googleClientId,
+  client_secret: config.googleClientSecret,
+  scope: YOUTUBE_SCOPE,
+});
+
+// Google client configuration returned for every non-dynamic client lookup.
+// It only depends on startup config, so it is built once and shared.
+const GOOGLE_CLIENT_INFO: OAuthClientInformationFull = Object.freeze({
+  client_id: config.googleClientId,
+  client_secret: config.googleClientSecret,
+  // Accept common redirect patterns for MCP clients
+  redirect_uris: [
+    'http://localhost:3000/callback',
+    'http://localhost:8080/callback',
+    'http://127.0.0.1:3000/callback',
+    'http://127.0.0.1:8080/callback',
+    config.googleRedirectUri || `http://localhost:${config.port}/oauth/callback`,
+  ],
+  grant_types: ['authorization_code', 'refresh_token'],
+  response_types: ['code'],
+  scope: YOUTUBE_SCOPE,
+  token_endpoint_auth_method: 'client_secret_post',
+});
+
+// Upper bound on how long a verified token is trusted without asking Google
+// again, so revoked tokens stop working within this window
+const VERIFIED_TOKEN_TTL_MS = 5 * 60 * 1000;
+
+// Verified access tokens, keyed by token digest (see secretKey). Every MCP
+// request is bearer-checked, and without this each one would round-trip to
+// Google's tokeninfo endpoint. Entries omit the token itself; it is put back
+// from the request on a hit, so the cache never holds a bearer credential.
+const verifiedTokens = new LRUCache<string, Omit<AuthInfo, 'token'>>({
+  max: 10000,
+  ttl: VERIFIED_TOKEN_TTL_MS,
+});
+
+// Split scope lists, keyed by the space-delimited scope string from tokeninfo.
+// Tokens issued to our client share the same scope string, so each distinct
+// value is split once and the array is shared by every AuthInfo that uses it.
+const parsedScopes = new Map<string, string[]>();
+
+function parseScopes(scope: string): string[] {
+  let scopes = parsedScopes.get(scope);
+  if (scopes === undefined) {
+    scopes = scope.split(' ');
+    parsedScopes.set(scope, scopes);
+  }
+  return scopes;
+}
+
 // In-memory store for dynamically registered clients
-const registeredClients = new Map<string, OAuthClientInformationFull>();
+// Registration is an open endpoint, so the store is bounded: a client that
+// hasn't been looked up recently is evicted first and simply re-registers
+const registeredClients = new LRUCache<string, OAuthClientInformationFull>({
+  max: 1000,
+});
 
 /**
  * Extended ProxyOAuthServerProvider with dynamic client registration support
@@ -40,18 +114,22 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
         // Check if this is a dynamically registered client
         const registered = registeredClients.get(clientId);
 
-        logger.debug('Looking up client', {
-          clientId,
-          found: !!registered,
-          registeredCount: registeredClients.size,
-        });
+        if (LOG_DEBUG) {
+          logger.debug('Looking up client', {
+            clientId,
+            found: !!registered,
+            registeredCount: registeredClients.size,
+          });
+        }
 
         if (registered) {
           // Return the registered client info AS-IS for validation
           // We'll swap in Google's credentials during the token exchange
-          logger.debug('Returning registered client info', {
-            clientId: registered.client_id,
-          });
+          if (LOG_DEBUG) {
+            logger.debug('Returning registered client info', {
+              clientId: registered.client_id,
+            });
+          }
 
           return registered;
         }
@@ -67,7 +145,7 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
           client_id: clientId,
           client_secret: clientSecret,
           client_id_issued_at: Math.floor(Date.now() / 1000),
-          scope: YOUTUBE_SCOPES.join(' '),
+          scope: YOUTUBE_SCOPE,
         };
 
         registeredClients.set(clientId, fullClientInfo);
@@ -96,11 +174,6 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
     params: AuthorizationParams,
     res: Response
   ): Promise<void> {
-    // Use our callback endpoint as the redirect_uri
-    // Google will redirect here after user authorization
-    const ourRedirectUri = config.googleRedirectUri ||
-      `https://ytmusic.dumawtf.com/oauth/callback`;
-
     // Store the client info in state so we can retrieve it in the callback
     // The state parameter will be echoed back by Google
     const originalState = params.state || '';
@@ -116,27 +189,24 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
     const encodedState = Buffer.from(stateData).toString('base64url');
 
     // Create a client object with Google's credentials for the authorization request
-    const googleClient: OAuthClientInformationFull = {
-      ...client,
-      client_id: config.googleClientId,
-      client_secret: config.googleClientSecret,
-      scope: YOUTUBE_SCOPES.join(' '),
-    };
+    const googleClient: OAuthClientInformationFull = { ...client, ...GOOGLE_CREDENTIALS };
 
     const paramsWithFixes: AuthorizationParams = {
       ...params,
       scopes: YOUTUBE_SCOPES,
-      redirectUri: ourRedirectUri, // Use OUR registered callback
+      redirectUri: OUR_REDIRECT_URI, // Use OUR registered callback
       state: encodedState, // Store client's redirect_uri in state
     };
 
-    logger.debug('Authorizing with Google', {
-      scopes: paramsWithFixes.scopes,
-      ourRedirectUri,
-      clientRedirectUri,
-      registeredClientId: client.client_id,
-      googleClientId: googleClient.client_id,
-    });
+    if (LOG_DEBUG) {
+      logger.debug('Authorizing with Google', {
+        scopes: paramsWithFixes.scopes,
+        ourRedirectUri: OUR_REDIRECT_URI,
+        clientRedirectUri,
+        registeredClientId: client.client_id,
+        googleClientId: googleClient.client_id,
+      });
+    }
 
     return super.authorize(googleClient, paramsWithFixes, res);
   }
@@ -152,22 +222,13 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
     _redirectUri?: string,
     resource?: URL
   ) {
-    // Use OUR redirect_uri (must match what we sent to Google)
-    const ourRedirectUri = config.googleRedirectUri ||
-      `https://ytmusic.dumawtf.com/oauth/callback`;
-
     // Create a client object with Google's credentials for the upstream exchange
     // The 'client' parameter has the registered client's credentials (used for validation)
     // But we need Google's credentials to exchange the code with Google
-    const googleClient: OAuthClientInformationFull = {
-      ...client,
-      client_id: config.googleClientId,
-      client_secret: config.googleClientSecret,
-      scope: YOUTUBE_SCOPES.join(' '),
-    };
+    const googleClient: OAuthClientInformationFull = { ...client, ...GOOGLE_CREDENTIALS };
 
     logger.info('Exchanging authorization code', {
-      redirectUri: ourRedirectUri,
+      redirectUri: OUR_REDIRECT_URI,
       registeredClientId: client.client_id,
       googleClientId: googleClient.client_id,
       hasCodeVerifier: !!codeVerifier,
@@ -179,7 +240,7 @@ class DynamicClientProxyProvider extends ProxyOAuthServerProvider {
         googleClient, // Use Google credentials for upstream exchange
         authorizationCode,
         codeVerifier,
-        ourRedirectUri, // Use OUR redirect_uri (matches authorize)
+        OUR_REDIRECT_URI, // Use OUR redirect_uri (must match what we sent to Google)
         resource
       );
 
@@ -213,77 +274,71 @@ function createOAuthProvider(): OAuthProvider {
 
     // Verify Google access tokens
     verifyAccessToken: async (token: string): Promise<AuthInfo> => {
-      try {
-        const response = await fetch(
-          `https://oauth2.googleapis.com/tokeninfo?access_token=${token}`
-        );
-
-        if (!response.ok) {
-          const errorText = await response.text();
-          logger.error('Google tokeninfo failed', {
-            status: response.status,
-            error: errorText
-          });
-          throw new Error(`Token validation failed: ${response.status}`);
-        }
+      const tokenKey = secretKey(token);
+      const cached = verifiedTokens.get(tokenKey);
+      if (cached !== undefined) {
+        return { ...cached, token };
+      }
 
-        const tokenInfo = (await response.json()) as {
-          aud: string;
-          scope: string;
-          expires_in: string;
-          email?: string;
-        };
+      // Network failures propagate as-is and surface as a server error;
+      // rejections by Google are InvalidTokenError so the bearer middleware
+      // answers 401 with a WWW-Authenticate challenge instead of 500
+      const response = await fetch(GOOGLE_TOKENINFO_URL + encodeURIComponent(token));
+
+      if (!response.ok) {
+        const errorText = await response.text();
+        logger.warn('Google tokeninfo rejected token', {
+          status: response.status,
+          error: errorText
+        });
+        throw new InvalidTokenError(`Token validation failed: ${response.status}`);
+      }
+
+      const tokenInfo = (await response.json()) as {
+        aud: string;
+        scope: string;
+        expires_in: string;
+        email?: string;
+      };
 
-        // Log token info for debugging (not the actual token)
+      // Log token info for debugging (not the actual token)
+      if (LOG_DEBUG) {
         logger.debug('Token info received', {
           aud: tokenInfo.aud,
           expectedClientId: config.googleClientId,
           scope: tokenInfo.scope,
           expiresIn: tokenInfo.expires_in,
         });
+      }
 
-        // Verify the token is for our client
-        if (tokenInfo.aud !== config.googleClientId) {
-          logger.error('Token audience mismatch', {
-            tokenAud: tokenInfo.aud,
-            expectedClientId: config.googleClientId,
-          });
-          throw new Error(`Token audience mismatch: got ${tokenInfo.aud}, expected ${config.googleClientId}`);
-        }
+      // Verify the token is for our client
+      if (tokenInfo.aud !== config.googleClientId) {
+        logger.warn('Token audience mismatch', {
+          tokenAud: tokenInfo.aud,
+          expectedClientId: config.googleClientId,
+        });
+        throw new InvalidTokenError('Token audience mismatch');
+      }
 
-        return {
-          token,
-          clientId: config.googleClientId,
-          scopes: tokenInfo.scope.split(' '),
-          expiresAt: Date.now() + parseInt(tokenInfo.expires_in) * 1000,
-        };
-      } catch (error) {
-        const errorMessage = error instanceof Error ? error.message : 'Unknown error';
-        logger.error('Token verification failed', { error: errorMessage });
-        throw new Error(`Authentication failed - ${errorMessage}`);
+      const expiresInMs = parseInt(tokenInfo.expires_in) * 1000;
+      const verified: Omit<AuthInfo, 'token'> = {
+        clientId: config.googleClientId,
+        scopes: parseScopes(tokenInfo.scope),
+        expiresAt: Date.now() + expiresInMs,
+      };
+
+      // Never trust a cached verification past the token's own expiry
+      const cacheTtl = Math.min(VERIFIED_TOKEN_TTL_MS, expiresInMs);
+      if (cacheTtl > 0) {
+        verifiedTokens.set(tokenKey, verified, { ttl: cacheTtl });
       }
+
+      return { ...verified, token };
     },
 
     // Get client configuration
     // Use our Google OAuth client credentials, not the MCP client's ID
-    getClient: async (_clientId: string) => {
-      return {
-        client_id: config.googleClientId,
-        client_secret: config.googleClientSecret,
-        // Accept common redirect patterns for MCP clients
-        redirect_uris: [
-          'http://localhost:3000/callback',
-          'http://localhost:8080/callback',
-          'http://127.0.0.1:3000/callback',
-          'http://127.0.0.1:8080/callback',
-          config.googleRedirectUri || `http://localhost:${config.port}/oauth/callback`,
-        ],
-        grant_types: ['authorization_code', 'refresh_token'],
-        response_types: ['code'],
-        scope: YOUTUBE_SCOPES.join(' '),
-        token_endpoint_auth_method: 'client_secret_post',
-      };
-    },
+    getClient: async (_clientId: string) => GOOGLE_CLIENT_INFO,
   });
 
   logger.info('Google OAuth provider initialized', {
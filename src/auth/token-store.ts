@@ -1,11 +1,44 @@
 import { createLogger } from '../utils/logger.js';
 import { config } from '../config.js';
+import { logTag } from '../utils/hash.js';
 import { promises as fs } from 'fs';
 import { createCipheriv, createDecipheriv, randomBytes } from 'crypto';
 import path from 'path';
 
 const logger = createLogger('token-store');
 
+// setToken runs whenever a session presents a new token; resolve the level once
+const LOG_INFO = logger.isInfoEnabled();
+
+// How often expired tokens are swept out of the store
+const SWEEP_INTERVAL_MS = 60000;
+
+/**
+ * Resolve the AES-256 key from config
+ * A base64 key that decodes to 32 bytes is used directly; any other value
+ * is used as raw bytes, padded/truncated to 32 bytes
+ */
+function resolveEncryptionKey(): Buffer {
+  const key = config.encryptionKey;
+  if (!key) {
+    logger.warn('No encryption key configured, using insecure default');
+    // This should not happen in production - ENCRYPTION_KEY env var should be set
+    return Buffer.from('default-insecure-key-32-bytes!!!'); // 32 bytes
+  }
+
+  // Buffer.from never throws on bad base64, so check the decoded length
+  const decoded = Buffer.from(key, 'base64');
+  if (decoded.length === 32) {
+    return decoded;
+  }
+
+  const keyBuffer = Buffer.from(key);
+  if (keyBuffer.length < 32) {
+    return Buffer.concat([keyBuffer, Buffer.alloc(32 - keyBuffer.length)]);
+  }
+  return keyBuffer.subarray(0, 32);
+}
+
 export interface StoredToken {
   accessToken: string;
   refreshToken: string;
@@ -22,12 +55,18 @@ class TokenStore {
   private currentSessionId: string | null = null;
   private saveTimeout: NodeJS.Timeout | null = null;
   private isInitialized = false;
+  // Decoded once; every save and load reuses it
+  private readonly encryptionKey = resolveEncryptionKey();
 
   constructor() {
     // Load tokens from file asynchronously
     this.initialize().catch(error => {
       logger.error('Failed to initialize token store', { error });
     });
+
+    // Expired tokens were previously only dropped on the next restart;
+    // sweep them in the background so lookups never see them
+    setInterval(() => this.sweepExpired(), SWEEP_INTERVAL_MS).unref();
   }
 
   /**
@@ -39,6 +78,13 @@ class TokenStore {
     logger.info('Token store initialized', {
       storedTokens: this.tokens.size,
     });
+
+    // Tokens live in this process (backed by a local file), so replicas
+    // don't share sessions. Surface that at boot rather than as sporadic
+    // auth failures behind a load balancer.
+    if (config.redisUrl) {
+      logger.warn('REDIS_URL is set but token storage is process-local; run a single replica or use sticky sessions');
+    }
   }
 
   /**
@@ -47,10 +93,31 @@ class TokenStore {
   setToken(sessionId: string, token: StoredToken): void {
     this.tokens.set(sessionId, token);
     this.currentSessionId = sessionId;
-    logger.info('Token stored', { sessionId });
+    if (LOG_INFO) {
+      logger.info('Token stored', { session: logTag(sessionId) });
+    }
     this.scheduleSave();
   }
 
+  /**
+   * Record the bearer token presented on an MCP request
+   * Reuses the stored record while the token is unchanged, so repeated
+   * requests on a session neither allocate a new record nor schedule a save
+   */
+  upsertAccessToken(sessionId: string, accessToken: string, expiresAt: number): void {
+    const existing = this.tokens.get(sessionId);
+    if (existing !== undefined && existing.accessToken === accessToken) {
+      this.currentSessionId = sessionId;
+      return;
+    }
+
+    this.setToken(sessionId, {
+      accessToken,
+      refreshToken: '', // Not available from bearer auth
+      expiresAt,
+    });
+  }
+
   /**
    * Get token for a session
    */
@@ -116,7 +183,7 @@ class TokenStore {
     if (this.currentSessionId === sessionId) {
       this.currentSessionId = null;
     }
-    logger.info('Token removed', { sessionId });
+    logger.info('Token removed', { session: logTag(sessionId) });
     this.scheduleSave();
   }
 
@@ -130,6 +197,28 @@ class TokenStore {
     this.scheduleSave();
   }
 
+  /**
+   * Remove tokens past their expiry
+   */
+  private sweepExpired(): void {
+    const now = Date.now();
+    let removed = 0;
+    for (const [sessionId, token] of this.tokens) {
+      if (token.expiresAt < now) {
+        this.tokens.delete(sessionId);
+        if (this.currentSessionId === sessionId) {
+          this.currentSessionId = null;
+        }
+        removed++;
+      }
+    }
+
+    if (removed > 0) {
+      logger.debug('Expired tokens swept', { removed, remaining: this.tokens.size });
+      this.scheduleSave();
+    }
+  }
+
   /**
    * Schedule a debounced save to file
    * Prevents excessive writes during rapid token updates
@@ -149,9 +238,8 @@ class TokenStore {
    * Encrypt data using AES-256-GCM
    */
   private encrypt(text: string): string {
-    const key = this.getEncryptionKey();
     const iv = randomBytes(16);
-    const cipher = createCipheriv('aes-256-gcm', key, iv);
+    const cipher = createCipheriv('aes-256-gcm', this.encryptionKey, iv);
 
     let encrypted = cipher.update(text, 'utf8', 'hex');
     encrypted += cipher.final('hex');
@@ -166,7 +254,6 @@ class TokenStore {
    * Decrypt data using AES-256-GCM
    */
   private decrypt(encryptedData: string): string {
-    const key = this.getEncryptionKey();
     const parts = encryptedData.split(':');
 
     if (parts.length !== 3 || !parts[0] || !parts[1] || !parts[2]) {
@@ -177,7 +264,7 @@ class TokenStore {
     const authTag = Buffer.from(parts[1], 'hex');
     const encrypted = parts[2];
 
-    const decipher = createDecipheriv('aes-256-gcm', key, iv);
+    const decipher = createDecipheriv('aes-256-gcm', this.encryptionKey, iv);
     decipher.setAuthTag(authTag);
 
     let decrypted: string = decipher.update(encrypted, 'hex', 'utf8');
@@ -186,30 +273,6 @@ class TokenStore {
     return decrypted;
   }
 
-  /**
-   * Get encryption key from config or generate a temporary one
-   */
-  private getEncryptionKey(): Buffer {
-    const key = config.encryptionKey;
-    if (!key) {
-      logger.warn('No encryption key configured, using insecure default');
-      // This should not happen in production - ENCRYPTION_KEY env var should be set
-      return Buffer.from('default-insecure-key-32-bytes!'); // 32 bytes
-    }
-
-    // Convert base64 key to buffer, or hash if it's not base64
-    try {
-      return Buffer.from(key, 'base64');
-    } catch {
-      // If not valid base64, use it as-is (padded/truncated to 32 bytes)
-      const keyBuffer = Buffer.from(key);
-      if (keyBuffer.length < 32) {
-        return Buffer.concat([keyBuffer, Buffer.alloc(32 - keyBuffer.length)]);
-      }
-      return keyBuffer.slice(0, 32);
-    }
-  }
-
   /**
    * Save tokens to encrypted file
    */
@@ -11,6 +11,7 @@ const ConfigSchema = z.object({
   // Server
   port: z.number().default(8081),
   nodeEnv: z.enum(['development', 'production', 'test']).default('development'),
+  logLevel: z.enum(['error', 'warn', 'info', 'debug']).optional(),
 
   // Google OAuth
   googleClientId: z.string().min(1),
@@ -24,6 +25,10 @@ const ConfigSchema = z.object({
   musicBrainzRateLimit: z.number().default(1000), // 1 request per second
   musicBrainzUserAgent: z.string().default('YouTubeMusicMCPServer/3.0.0'),
 
+  // YouTube Music InnerTube (client-side token bucket to stay clear of 429s)
+  ytMusicRateLimitPerMinute: z.number().min(1).default(300),
+  ytMusicRateLimitPerHour: z.number().min(1).default(10000),
+
   // Spotify
   spotifyClientId: z.string().min(1),
   spotifyClientSecret: z.string().min(1),
@@ -39,6 +44,9 @@ const ConfigSchema = z.object({
   // Session
   sessionTtl: z.number().default(3600), // 1 hour in seconds
 
+  // Health checks
+  healthCacheTtl: z.number().min(1).default(5), // seconds
+
   // Token Storage
   tokenStoragePath: z.string().default('/data/tokens.json'),
 
@@ -54,6 +62,7 @@ function loadConfig() {
   const rawConfig = {
     port: parseInt(process.env['PORT'] ?? '8081', 10),
     nodeEnv: process.env['NODE_ENV'] ?? 'development',
+    logLevel: process.env['LOG_LEVEL'] || undefined,
 
     googleClientId: process.env['GOOGLE_OAUTH_CLIENT_ID'] ?? '',
     googleClientSecret: process.env['GOOGLE_OAUTH_CLIENT_SECRET'] ?? '',
@@ -64,6 +73,9 @@ function loadConfig() {
     musicBrainzRateLimit: parseInt(process.env['MUSICBRAINZ_RATE_LIMIT'] ?? '1000', 10),
     musicBrainzUserAgent: process.env['MUSICBRAINZ_USER_AGENT'] ?? 'YouTubeMusicMCPServer/3.0.0',
 
+    ytMusicRateLimitPerMinute: parseInt(process.env['YTMUSIC_RATE_LIMIT_PER_MINUTE'] ?? '300', 10),
+    ytMusicRateLimitPerHour: parseInt(process.env['YTMUSIC_RATE_LIMIT_PER_HOUR'] ?? '10000', 10),
+
     spotifyClientId: process.env['SPOTIFY_CLIENT_ID'] ?? '',
     spotifyClientSecret: process.env['SPOTIFY_CLIENT_SECRET'] ?? '',
 
@@ -75,6 +87,8 @@ function loadConfig() {
 
     sessionTtl: parseInt(process.env['SESSION_TTL'] ?? '3600', 10),
 
+    healthCacheTtl: parseInt(process.env['HEALTH_CACHE_TTL'] ?? '5', 10),
+
     tokenStoragePath: process.env['TOKEN_STORAGE_PATH'] ?? '/data/tokens.json',
 
     bypassAuth: process.env['BYPASS_AUTH_FOR_TESTING'] === 'true',
@@ -103,6 +117,7 @@ function loadConfig() {
   return result.data;
 }
 
-export const config = loadConfig();
+// Parsed once at boot and frozen, so nothing can drift from the environment
+export const config = Object.freeze(loadConfig());
 
 export type Config = z.infer<typeof ConfigSchema>;
@@ -131,10 +131,10 @@ export const db = {
       throw new Error('Database not configured - DATABASE_URL is missing');
     }
 
-    const start = Date.now();
+    const start = performance.now();
     try {
       const result = await pool.query(text, params);
-      const duration = Date.now() - start;
+      const duration = Math.round(performance.now() - start);
 
       // Log slow queries
       if (duration > 1000) {
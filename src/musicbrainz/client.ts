@@ -1,4 +1,4 @@
-import { MusicBrainzApi } from 'musicbrainz-api';
+import type { MusicBrainzApi } from 'musicbrainz-api';
 import { config } from '../config.js';
 import { createLogger } from '../utils/logger.js';
 import { FixedIntervalRateLimiter } from '../utils/rate-limiter.js';
@@ -7,16 +7,12 @@ import type { MBArtist, MBRecording, MBTag } from '../types/index.js';
 const logger = createLogger('musicbrainz-client');
 
 export class MusicBrainzClient {
-  private api: MusicBrainzApi;
+  // musicbrainz-api drags in a large dependency graph and is only needed
+  // by recommendation tools, so it is loaded on first use instead of at boot
+  private api: Promise<MusicBrainzApi> | null = null;
   private rateLimiter: FixedIntervalRateLimiter;
 
   constructor() {
-    this.api = new MusicBrainzApi({
-      appName: 'YouTubeMusicMCPServer',
-      appVersion: '3.0.0',
-      appContactInfo: 'https://github.com/youtube-music-mcp-server',
-    });
-
     // MusicBrainz has a strict 1 request per second limit
     this.rateLimiter = new FixedIntervalRateLimiter(
       'musicbrainz',
@@ -26,16 +22,35 @@ export class MusicBrainzClient {
     logger.info('MusicBrainz client initialized');
   }
 
+  /**
+   * Load and construct the MusicBrainz API client once
+   */
+  private getApi(): Promise<MusicBrainzApi> {
+    this.api ??= import('musicbrainz-api').then(({ MusicBrainzApi }) =>
+      new MusicBrainzApi({
+        appName: 'YouTubeMusicMCPServer',
+        appVersion: '3.0.0',
+        appContactInfo: 'https://github.com/youtube-music-mcp-server',
+      })
+    ).catch((error: unknown) => {
+      // Let the next call retry instead of caching the failure
+      this.api = null;
+      throw error;
+    });
+    return this.api;
+  }
+
   /**
    * Search for artists by name
    */
   async searchArtist(name: string, limit: number = 5): Promise<MBArtist[]> {
     await this.rateLimiter.acquire();
+    const api = await this.getApi();
 
     logger.debug('Searching artist', { name, limit });
 
     try {
-      const result = await this.api.search('artist', { query: name, limit });
+      const result = await api.search('artist', { query: name, limit });
 
       return result.artists.map((artist) => ({
         mbid: artist.id,
@@ -54,11 +69,12 @@ export class MusicBrainzClient {
    */
   async getArtistTags(mbid: string): Promise<MBTag[]> {
     await this.rateLimiter.acquire();
+    const api = await this.getApi();
 
     logger.debug('Getting artist tags', { mbid });
 
     try {
-      const artist = await this.api.lookup('artist', mbid, ['tags']) as {
+      const artist = await api.lookup('artist', mbid, ['tags']) as {
         tags?: Array<{ name: string; count?: number }>;
       };
 
@@ -87,6 +103,7 @@ export class MusicBrainzClient {
     limit: number = 5
   ): Promise<MBRecording[]> {
     await this.rateLimiter.acquire();
+    const api = await this.getApi();
 
     logger.debug('Searching recording', { title, artist, limit });
 
@@ -96,7 +113,7 @@ export class MusicBrainzClient {
         query += ` AND artist:"${artist}"`;
       }
 
-      const result = await this.api.search('recording', { query, limit });
+      const result = await api.search('recording', { query, limit });
 
       return result.recordings.map((rec) => ({
         mbid: rec.id,
@@ -115,11 +132,12 @@ export class MusicBrainzClient {
    */
   async getArtistDetails(mbid: string): Promise<MBArtist & { relations?: unknown }> {
     await this.rateLimiter.acquire();
+    const api = await this.getApi();
 
     logger.debug('Getting artist details', { mbid });
 
     try {
-      const artist = await this.api.lookup('artist', mbid, [
+      const artist = await api.lookup('artist', mbid, [
         'tags',
         'artist-rels',
       ]) as {
@@ -153,11 +171,12 @@ export class MusicBrainzClient {
    */
   async getRecordingDetails(mbid: string): Promise<MBRecording & { tags?: MBTag[] }> {
     await this.rateLimiter.acquire();
+    const api = await this.getApi();
 
     logger.debug('Getting recording details', { mbid });
 
     try {
-      const recording = await this.api.lookup('recording', mbid, [
+      const recording = await api.lookup('recording', mbid, [
         'tags',
         'artist-credits',
       ]) as {
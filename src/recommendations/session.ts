@@ -6,6 +6,9 @@ const logger = createLogger('session-manager');
 
 export class SessionManager {
   private sessions: Map<string, PlaylistSession> = new Map();
+  // Expiry deadlines on the monotonic clock, so wall-clock jumps can't
+  // expire sessions early and lookups don't re-parse createdAt
+  private expiries: Map<string, number> = new Map();
   private sessionTtl: number = 3600000; // 1 hour in milliseconds
 
   constructor(ttlSeconds: number = 3600) {
@@ -35,6 +38,7 @@ export class SessionManager {
     };
 
     this.sessions.set(sessionId, session);
+    this.expiries.set(sessionId, performance.now() + this.sessionTtl);
 
     logger.info('Session created', { sessionId, mode });
 
@@ -56,9 +60,9 @@ export class SessionManager {
     }
 
     // Check if expired
-    const createdAt = new Date(session.createdAt).getTime();
-    if (Date.now() - createdAt > this.sessionTtl) {
+    if (this.isExpired(sessionId, performance.now())) {
       this.sessions.delete(sessionId);
+      this.expiries.delete(sessionId);
       logger.debug('Session expired', { sessionId });
       return undefined;
     }
@@ -172,6 +176,7 @@ export class SessionManager {
    */
   deleteSession(sessionId: string): void {
     this.sessions.delete(sessionId);
+    this.expiries.delete(sessionId);
     logger.debug('Session deleted', { sessionId });
   }
 
@@ -179,12 +184,11 @@ export class SessionManager {
    * Get all active sessions (for admin/debugging)
    */
   getActiveSessions(): PlaylistSession[] {
-    const now = Date.now();
+    const now = performance.now();
     const active: PlaylistSession[] = [];
 
-    for (const session of this.sessions.values()) {
-      const createdAt = new Date(session.createdAt).getTime();
-      if (now - createdAt <= this.sessionTtl) {
+    for (const [sessionId, session] of this.sessions) {
+      if (!this.isExpired(sessionId, now)) {
         active.push(session);
       }
     }
@@ -197,16 +201,19 @@ export class SessionManager {
    */
   private scheduleCleanup(sessionId: string): void {
     setTimeout(() => {
-      if (this.sessions.has(sessionId)) {
-        const session = this.sessions.get(sessionId);
-        if (session) {
-          const createdAt = new Date(session.createdAt).getTime();
-          if (Date.now() - createdAt > this.sessionTtl) {
-            this.sessions.delete(sessionId);
-            logger.debug('Session cleaned up', { sessionId });
-          }
-        }
+      if (this.sessions.has(sessionId) && this.isExpired(sessionId, performance.now())) {
+        this.sessions.delete(sessionId);
+        this.expiries.delete(sessionId);
+        logger.debug('Session cleaned up', { sessionId });
       }
     }, this.sessionTtl + 1000);
   }
+
+  /**
+   * Check a session's deadline against a monotonic timestamp
+   */
+  private isExpired(sessionId: string, now: number): boolean {
+    const expiresAt = this.expiries.get(sessionId);
+    return expiresAt === undefined || now > expiresAt;
+  }
 }
@@ -25,9 +25,36 @@ import { SessionManager } from './recommendations/session.js';
 import { oauth } from './auth/smithery-oauth-provider.js';
 import { tokenStore } from './auth/token-store.js';
 import { db, initializeDatabase, checkDatabaseHealth } from './database/client.js';
+import { HealthMonitor, checkMemoryUsage } from './utils/health.js';
+import { googleAgent } from './utils/http.js';
+import { logTag } from './utils/hash.js';
 
 const logger = createLogger('server');
 
+// Resolved once at startup so the per-request auth middleware can skip
+// building debug metadata when debug logging is off
+const LOG_DEBUG = logger.isDebugEnabled();
+
+// JSON-RPC error bodies for requests rejected before reaching a transport.
+// None of them echo a request id, so they are built once and shared.
+const NO_SESSION_ERROR = Object.freeze({
+  jsonrpc: '2.0',
+  error: Object.freeze({
+    code: -32000,
+    message: 'Bad Request: No valid session ID provided',
+  }),
+  id: null,
+});
+
+const INTERNAL_ERROR = Object.freeze({
+  jsonrpc: '2.0',
+  error: Object.freeze({
+    code: -32603,
+    message: 'Internal server error',
+  }),
+  id: null,
+});
+
 export interface ServerContext {
   ytMusic: YouTubeMusicClient;
   ytData: YouTubeDataClient;
@@ -37,10 +64,18 @@ export interface ServerContext {
   sessions: SessionManager;
   spotify: SpotifyClient;
   reccobeats: ReccoBeatsClient;
+  health: HealthMonitor;
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   db: any; // Database client for adaptive playlists
 }
 
+/**
+ * A client holding resources that must be released on shutdown
+ */
+export interface Closeable {
+  close(): Promise<void>;
+}
+
 export interface Server {
   start: () => Promise<void>;
   close: () => Promise<void>;
@@ -60,13 +95,29 @@ export async function createServer(): Promise<Server> {
   const listenBrainz = new ListenBrainzClient();
   const spotify = new SpotifyClient();
   const reccobeats = new ReccoBeatsClient();
-  const sessions = new SessionManager();
+  const sessions = new SessionManager(config.sessionTtl);
+  // Health checks run on their own timer; /health and get_server_status
+  // both serve the latest result
+  const health = new HealthMonitor('3.0.0', {
+    database: checkDatabaseHealth,
+    memory: checkMemoryUsage,
+  }, config.healthCacheTtl * 1000);
   const recommendations = new RecommendationEngine(
     musicBrainz,
     listenBrainz,
     ytMusic
   );
 
+  // Everything with a close() is registered here, so shutdown can't miss one
+  const closeables: Array<[string, Closeable]> = [
+    ['ytMusic', ytMusic],
+    ['ytData', ytData],
+    ['musicBrainz', musicBrainz],
+    ['listenBrainz', listenBrainz],
+    ['spotify', spotify],
+    ['reccobeats', reccobeats],
+  ];
+
   // Create context for tools
   const context: ServerContext = {
     ytMusic,
@@ -77,6 +128,7 @@ export async function createServer(): Promise<Server> {
     sessions,
     spotify,
     reccobeats,
+    health,
     db,
   };
 
@@ -95,17 +147,29 @@ export async function createServer(): Promise<Server> {
   // Trust proxy for proper IP detection behind reverse proxies (ngrok, Smithery, etc.)
   app.set('trust proxy', 1);
 
-  app.use(express.json());
+  // Express hashes every res.json()/res.send() body to build a weak ETag.
+  // Health probes and JSON-RPC replies are never conditionally re-requested,
+  // so that hash is pure per-response overhead.
+  app.set('etag', false);
+
+  // Only the MCP transports consume JSON bodies. The OAuth router brings its
+  // own form/JSON parsers, so a global parser would just add work to the
+  // token and authorize endpoints.
+  app.use(['/mcp', '/messages'], express.json());
 
   // Health check endpoint
   app.get('/health', async (_req: Request, res: Response) => {
-    const dbHealth = await checkDatabaseHealth();
-    res.json({
-      status: 'healthy',
-      version: '3.0.0',
-      timestamp: new Date().toISOString(),
-      database: dbHealth,
-    });
+    try {
+      // Pre-serialized body; the short max-age lets proxies and sidecars
+      // absorb repeat polls between refreshes
+      res
+        .set('Cache-Control', 'max-age=1')
+        .type('json')
+        .send(await health.getSerialized());
+    } catch (error) {
+      logger.error('Health check failed', { error });
+      res.status(503).json({ status: 'unhealthy' });
+    }
   });
 
   // Mount OAuth routes using MCP SDK's mcpAuthRouter for local testing
@@ -204,15 +268,16 @@ export async function createServer(): Promise<Server> {
         // Store token with MCP session ID
         const sessionId = req.headers['mcp-session-id'] as string | undefined;
         if (sessionId) {
-          // Note: We don't have refresh token or expiry from the bearer token itself
-          // The OAuth provider handles token refresh
-          tokenStore.setToken(sessionId, {
-            accessToken: token,
-            refreshToken: '', // Not available from bearer auth
-            expiresAt: Date.now() + 3600000, // Assume 1 hour
-          });
-          tokenStore.setCurrentSession(sessionId);
-          logger.debug('Token stored for YouTube Music API calls', { sessionId });
+          // The refresh token isn't available here; the OAuth provider handles
+          // refresh. The expiry comes from Google's tokeninfo via the verifier.
+          tokenStore.upsertAccessToken(
+            sessionId,
+            token,
+            req.auth?.expiresAt ?? Date.now() + 3600000 // Assume 1 hour if unknown
+          );
+          if (LOG_DEBUG) {
+            logger.debug('Token stored for YouTube Music API calls', { session: logTag(sessionId) });
+          }
         }
       }
       next();
@@ -222,38 +287,39 @@ export async function createServer(): Promise<Server> {
   }
 
   // Store transports for session management
-  const transports: {
-    streamable: Record<string, StreamableHTTPServerTransport>;
-    sse: Record<string, SSEServerTransport>;
-  } = {
-    streamable: {},
-    sse: {},
+  const transports = {
+    streamable: new Map<string, StreamableHTTPServerTransport>(),
+    sse: new Map<string, SSEServerTransport>(),
   };
 
   // Modern Streamable HTTP endpoint for MCP protocol
   app.post('/mcp', async (req: Request, res: Response) => {
     try {
       const sessionId = req.headers['mcp-session-id'] as string | undefined;
+      const existing = sessionId ? transports.streamable.get(sessionId) : undefined;
       let transport: StreamableHTTPServerTransport;
 
-      if (sessionId && transports.streamable[sessionId]) {
+      if (existing) {
         // Reuse existing transport
-        transport = transports.streamable[sessionId];
+        transport = existing;
       } else if (!sessionId && isInitializeRequest(req.body)) {
         // New initialization request
+        // The log tag is hashed once per session, not on every log line
+        let session = '';
         transport = new StreamableHTTPServerTransport({
           sessionIdGenerator: () => randomUUID(),
           onsessioninitialized: (newSessionId: string) => {
-            transports.streamable[newSessionId] = transport;
-            logger.info('MCP session initialized', { sessionId: newSessionId });
+            transports.streamable.set(newSessionId, transport);
+            session = logTag(newSessionId);
+            logger.info('MCP session initialized', { session });
           },
         });
 
         // Clean up transport when closed
         transport.onclose = () => {
           if (transport.sessionId) {
-            delete transports.streamable[transport.sessionId];
-            logger.info('MCP session closed', { sessionId: transport.sessionId });
+            transports.streamable.delete(transport.sessionId);
+            logger.info('MCP session closed', { session });
           }
         };
 
@@ -261,14 +327,7 @@ export async function createServer(): Promise<Server> {
         await mcpServer.connect(transport);
       } else {
         // Invalid request
-        res.status(400).json({
-          jsonrpc: '2.0',
-          error: {
-            code: -32000,
-            message: 'Bad Request: No valid session ID provided',
-          },
-          id: null,
-        });
+        res.status(400).json(NO_SESSION_ERROR);
         return;
       }
 
@@ -277,41 +336,35 @@ export async function createServer(): Promise<Server> {
     } catch (error) {
       logger.error('MCP request failed', { error });
       if (!res.headersSent) {
-        res.status(500).json({
-          jsonrpc: '2.0',
-          error: {
-            code: -32603,
-            message: 'Internal server error',
-          },
-          id: null,
-        });
+        res.status(500).json(INTERNAL_ERROR);
       }
     }
   });
 
-  // Handle GET requests for server-to-client notifications via SSE
-  app.get('/mcp', async (req: Request, res: Response) => {
-    const sessionId = req.headers['mcp-session-id'] as string | undefined;
-    if (!sessionId || !transports.streamable[sessionId]) {
-      res.status(400).send('Invalid or missing session ID');
-      return;
-    }
-
-    const transport = transports.streamable[sessionId];
-    await transport.handleRequest(req, res);
-  });
+  // GET (server-to-client notifications via SSE) and DELETE (session
+  // termination) both just route to the session's existing transport
+  const handleSessionRequest = async (req: Request, res: Response) => {
+    try {
+      const sessionId = req.headers['mcp-session-id'] as string | undefined;
+      const transport = sessionId ? transports.streamable.get(sessionId) : undefined;
+      if (!transport) {
+        res.status(400).send('Invalid or missing session ID');
+        return;
+      }
 
-  // Handle DELETE requests for session termination
-  app.delete('/mcp', async (req: Request, res: Response) => {
-    const sessionId = req.headers['mcp-session-id'] as string | undefined;
-    if (!sessionId || !transports.streamable[sessionId]) {
-      res.status(400).send('Invalid or missing session ID');
-      return;
+      await transport.handleRequest(req, res);
+    } catch (error) {
+      // Express 4 doesn't catch rejected async handlers, so without this
+      // a transport failure becomes an unhandled rejection and a hung request
+      logger.error('MCP session request failed', { method: req.method, error });
+      if (!res.headersSent) {
+        res.status(500).json(INTERNAL_ERROR);
+      }
     }
+  };
 
-    const transport = transports.streamable[sessionId];
-    await transport.handleRequest(req, res);
-  });
+  app.get('/mcp', handleSessionRequest);
+  app.delete('/mcp', handleSessionRequest);
 
   // Apply bearer auth to legacy SSE endpoints
   if (!config.bypassAuth) {
@@ -327,24 +380,41 @@ export async function createServer(): Promise<Server> {
   app.get('/sse', async (req: Request, res: Response) => {
     logger.info('SSE connection initiated (legacy transport)');
     const transport = new SSEServerTransport('/messages', res);
-    transports.sse[transport.sessionId] = transport;
+    transports.sse.set(transport.sessionId, transport);
+    const session = logTag(transport.sessionId);
 
     res.on('close', () => {
-      delete transports.sse[transport.sessionId];
-      logger.info('SSE connection closed', { sessionId: transport.sessionId });
+      transports.sse.delete(transport.sessionId);
+      logger.info('SSE connection closed', { session });
     });
 
-    await mcpServer.connect(transport);
+    try {
+      await mcpServer.connect(transport);
+    } catch (error) {
+      logger.error('SSE connection failed', { session, error });
+      transports.sse.delete(transport.sessionId);
+      if (!res.headersSent) {
+        res.status(500).json(INTERNAL_ERROR);
+      }
+    }
   });
 
   // Legacy message endpoint for older clients
   app.post('/messages', async (req: Request, res: Response) => {
     const sessionId = req.query.sessionId as string;
-    const transport = transports.sse[sessionId];
-    if (transport) {
-      await transport.handlePostMessage(req, res, req.body);
-    } else {
+    const transport = transports.sse.get(sessionId);
+    if (!transport) {
       res.status(400).send('No transport found for sessionId');
+      return;
+    }
+
+    try {
+      await transport.handlePostMessage(req, res, req.body);
+    } catch (error) {
+      logger.error('SSE message handling failed', { session: logTag(sessionId), error });
+      if (!res.headersSent) {
+        res.status(500).json(INTERNAL_ERROR);
+      }
     }
   });
 
@@ -354,6 +424,10 @@ export async function createServer(): Promise<Server> {
     async start() {
       // Initialize database (if configured)
       await initializeDatabase();
+      await health.start();
+
+      // Fire-and-forget: prime the pooled connection to YouTube Music
+      void ytMusic.warmUp();
 
       // Start HTTP server
       httpServer = app.listen(config.port, () => {
@@ -362,23 +436,26 @@ export async function createServer(): Promise<Server> {
         logger.info(`Health endpoint: http://localhost:${config.port}/health`);
         logger.info('OAuth routes: Managed by Smithery');
       });
+
+      // Node closes idle keep-alive sockets after 5s, well under the idle
+      // timeout of the proxy in front of us, so the proxy keeps reconnecting
+      // and occasionally reuses a socket we just closed (502). Outlive it;
+      // headersTimeout must stay above keepAliveTimeout.
+      httpServer.keepAliveTimeout = 65000;
+      httpServer.headersTimeout = 66000;
     },
 
     async close() {
       logger.info('Shutting down server...');
 
+      health.stop();
+
       // Close all active transports
-      for (const sessionId of Object.keys(transports.streamable)) {
-        const transport = transports.streamable[sessionId];
-        if (transport) {
-          transport.close();
-        }
+      for (const transport of transports.streamable.values()) {
+        transport.close();
       }
-      for (const sessionId of Object.keys(transports.sse)) {
-        const transport = transports.sse[sessionId];
-        if (transport) {
-          transport.close();
-        }
+      for (const transport of transports.sse.values()) {
+        transport.close();
       }
 
       if (httpServer) {
@@ -392,12 +469,14 @@ export async function createServer(): Promise<Server> {
         });
       }
 
-      // Close clients
-      await ytMusic.close();
-      await ytData.close();
-      await musicBrainz.close();
-      await listenBrainz.close();
-      await spotify.close();
+      // Close clients concurrently; one failing close doesn't skip the rest
+      const results = await Promise.allSettled(closeables.map(([, client]) => client.close()));
+      results.forEach((result, i) => {
+        if (result.status === 'rejected') {
+          logger.warn('Client failed to close', { client: closeables[i]?.[0], error: result.reason });
+        }
+      });
+      googleAgent.destroy();
 
       logger.info('Server shutdown complete');
     },
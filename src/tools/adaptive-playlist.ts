@@ -2,6 +2,7 @@ import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { z } from 'zod';
 import type { ServerContext } from '../server.js';
 import { createLogger } from '../utils/logger.js';
+import { jsonResult, errorResult, runTool } from './response.js';
 import { SessionManager } from '../adaptive-playlist/session-manager.js';
 import { RecommendationEngine } from '../adaptive-playlist/recommendation-engine.js';
 import { encodeProfile, decodeProfile, embedProfileCode } from '../adaptive-playlist/encoder.js';
@@ -9,6 +10,13 @@ import type { Profile, Context } from '../adaptive-playlist/types.js';
 
 const logger = createLogger('adaptive-playlist-tools');
 
+const SESSION_NOT_FOUND = errorResult('Session not found or expired');
+const START_PLAYLIST_CONVERSATION_FAILED = errorResult('Failed to start conversation');
+const CONTINUE_CONVERSATION_FAILED = errorResult('Failed to continue conversation');
+const GENERATE_ADAPTIVE_PLAYLIST_FAILED = errorResult('Failed to generate playlist');
+const VIEW_PROFILE_FAILED = errorResult('Invalid profile code');
+const DECODE_PLAYLIST_PROFILE_FAILED = errorResult('Failed to decode playlist profile');
+
 /**
  * Register adaptive playlist tools for AI-guided playlist creation
  */
@@ -56,40 +64,18 @@ export function registerAdaptivePlaylistTools(
     async ({ userId }) => {
       logger.debug('start_playlist_conversation called', { userId });
 
-      try {
+      return runTool(logger, 'start_playlist_conversation', START_PLAYLIST_CONVERSATION_FAILED, async () => {
         const finalUserId = userId || 'default_user';
         const session = await sessionManager.createSession(finalUserId);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(
-                {
-                  sessionId: session.sessionId,
-                  message: session.conversationHistory[0]?.message || 'Hello! Let\'s build your perfect playlist.',
-                  questionsAsked: session.questionsAsked,
-                  confidence: session.confidence,
-                  readyForPlaylist: false,
-                },
-                null,
-                2
-              ),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('start_playlist_conversation failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to start conversation' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          sessionId: session.sessionId,
+          message: session.conversationHistory[0]?.message || 'Hello! Let\'s build your perfect playlist.',
+          questionsAsked: session.questionsAsked,
+          confidence: session.confidence,
+          readyForPlaylist: false,
+        });
+      });
     }
   );
 
@@ -117,18 +103,10 @@ export function registerAdaptivePlaylistTools(
     async ({ sessionId, userMessage, extractedInfo }) => {
       logger.debug('continue_conversation called', { sessionId });
 
-      try {
+      return runTool(logger, 'continue_conversation', CONTINUE_CONVERSATION_FAILED, async () => {
         const session = await sessionManager.getSession(sessionId);
         if (!session) {
-          return {
-            content: [
-              {
-                type: 'text',
-                text: JSON.stringify({ error: 'Session not found or expired' }),
-              },
-            ],
-            isError: true,
-          };
+          return SESSION_NOT_FOUND;
         }
 
         // Generate next AI response based on current state
@@ -144,37 +122,15 @@ export function registerAdaptivePlaylistTools(
 
         const readyForPlaylist = sessionManager.isReadyForPlaylist(updated);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(
-                {
-                  sessionId: updated.sessionId,
-                  message: aiResponse,
-                  questionsAsked: updated.questionsAsked,
-                  confidence: updated.confidence,
-                  readyForPlaylist,
-                  currentProfile: updated.profile,
-                },
-                null,
-                2
-              ),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('continue_conversation failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to continue conversation' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          sessionId: updated.sessionId,
+          message: aiResponse,
+          questionsAsked: updated.questionsAsked,
+          confidence: updated.confidence,
+          readyForPlaylist,
+          currentProfile: updated.profile,
+        });
+      });
     }
   );
 
@@ -220,40 +176,23 @@ export function registerAdaptivePlaylistTools(
     }) => {
       logger.debug('generate_adaptive_playlist called', { sessionId, profileCode });
 
-      try {
+      return runTool(logger, 'generate_adaptive_playlist', GENERATE_ADAPTIVE_PLAYLIST_FAILED, async () => {
         let profile: Profile;
         let userId: string;
 
         if (sessionId) {
           const session = await sessionManager.getSession(sessionId);
           if (!session) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: JSON.stringify({ error: 'Session not found or expired' }),
-                },
-              ],
-              isError: true,
-            };
+            return SESSION_NOT_FOUND;
           }
 
           if (!sessionManager.isReadyForPlaylist(session)) {
-            return {
-              content: [
-                {
-                  type: 'text',
-                  text: JSON.stringify({
-                    error: 'Session not ready for playlist generation',
-                    questionsAsked: session.questionsAsked,
-                    confidence: session.confidence,
-                    requiredQuestions: 5,
-                    requiredConfidence: 21,
-                  }),
-                },
-              ],
-              isError: true,
-            };
+            return errorResult('Session not ready for playlist generation', {
+              questionsAsked: session.questionsAsked,
+              confidence: session.confidence,
+              requiredQuestions: 5,
+              requiredConfidence: 21,
+            });
           }
 
           profile = session.profile as Profile;
@@ -262,17 +201,7 @@ export function registerAdaptivePlaylistTools(
           profile = decodeProfile(profileCode);
           userId = 'profile_user';
         } else {
-          return {
-            content: [
-              {
-                type: 'text',
-                text: JSON.stringify({
-                  error: 'Either sessionId or profileCode must be provided',
-                }),
-              },
-            ],
-            isError: true,
-          };
+          return errorResult('Either sessionId or profileCode must be provided');
         }
 
         // Set userId in context
@@ -299,15 +228,7 @@ export function registerAdaptivePlaylistTools(
         );
 
         if (recommendations.length === 0) {
-          return {
-            content: [
-              {
-                type: 'text',
-                text: JSON.stringify({ error: 'No recommendations generated' }),
-              },
-            ],
-            isError: true,
-          };
+          return errorResult('No recommendations generated');
         }
 
         // Encode profile for embedding
@@ -321,10 +242,15 @@ export function registerAdaptivePlaylistTools(
             encodedProfile
           );
 
-          playlistId = await context.ytMusic.createPlaylist(playlistName, description, 'PRIVATE');
-
           const videoIds = recommendations.map((r) => r.track.videoId);
-          await context.ytMusic.addPlaylistItems(playlistId, videoIds);
+          try {
+            playlistId = await context.ytMusic.createPlaylist(playlistName, description, 'PRIVATE');
+            await context.ytMusic.addPlaylistItems(playlistId, videoIds);
+          } finally {
+            // Written through YouTube Music, so the Data API library cache
+            // doesn't see it unless told
+            context.ytData.invalidateLibrary();
+          }
 
           logger.info('Playlist created on YouTube Music', { playlistId, trackCount: videoIds.length });
         }
@@ -334,43 +260,21 @@ export function registerAdaptivePlaylistTools(
           await sessionManager.completeSession(sessionId);
         }
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(
-                {
-                  success: true,
-                  profileCode: encodedProfile,
-                  playlistId,
-                  trackCount: recommendations.length,
-                  avgScore: recommendations.reduce((sum, r) => sum + r.score, 0) / recommendations.length,
-                  tracks: recommendations.map((r) => ({
-                    videoId: r.track.videoId,
-                    title: r.track.title,
-                    artist: r.track.artist,
-                    score: r.score,
-                    breakdown: r.breakdown,
-                  })),
-                },
-                null,
-                2
-              ),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('generate_adaptive_playlist failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to generate playlist' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          success: true,
+          profileCode: encodedProfile,
+          playlistId,
+          trackCount: recommendations.length,
+          avgScore: recommendations.reduce((sum, r) => sum + r.score, 0) / recommendations.length,
+          tracks: recommendations.map((r) => ({
+            videoId: r.track.videoId,
+            title: r.track.title,
+            artist: r.track.artist,
+            score: r.score,
+            breakdown: r.breakdown,
+          })),
+        });
+      });
     }
   );
 
@@ -392,29 +296,11 @@ export function registerAdaptivePlaylistTools(
     async ({ profileCode }) => {
       logger.debug('view_profile called');
 
-      try {
+      return runTool(logger, 'view_profile', VIEW_PROFILE_FAILED, async () => {
         const profile = decodeProfile(profileCode);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(profile, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('view_profile failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Invalid profile code' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult(profile);
+      });
     }
   );
 
@@ -437,54 +323,24 @@ export function registerAdaptivePlaylistTools(
     async ({ playlistId }) => {
       logger.debug('decode_playlist_profile called', { playlistId });
 
-      try {
+      return runTool(logger, 'decode_playlist_profile', DECODE_PLAYLIST_PROFILE_FAILED, async () => {
         const playlist = await context.ytMusic.getPlaylist(playlistId);
         const description = (playlist as { description?: string }).description || '';
 
         // Extract profile code from description
         const codeMatch = description.match(/🧬:([1-9A-Z]-[0-9A-ZX]{35})/);
         if (!codeMatch) {
-          return {
-            content: [
-              {
-                type: 'text',
-                text: JSON.stringify({ error: 'No profile code found in playlist description' }),
-              },
-            ],
-            isError: true,
-          };
+          return errorResult('No profile code found in playlist description');
         }
 
         const profileCode = codeMatch[1] || '';
         const profile = decodeProfile(profileCode);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(
-                {
-                  profileCode,
-                  profile,
-                },
-                null,
-                2
-              ),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('decode_playlist_profile failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to decode playlist profile' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          profileCode,
+          profile,
+        });
+      });
     }
   );
 }
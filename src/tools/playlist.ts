@@ -2,9 +2,25 @@ import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { z } from 'zod';
 import type { ServerContext } from '../server.js';
 import { createLogger } from '../utils/logger.js';
+import { jsonResult, errorResult, runTool } from './response.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 
 const logger = createLogger('playlist-tools');
 
+const GET_PLAYLISTS_FAILED = errorResult('Failed to get playlists');
+const GET_PLAYLIST_DETAILS_FAILED = errorResult('Failed to get playlist details');
+const CREATE_PLAYLIST_FAILED = errorResult('Failed to create playlist');
+const EDIT_PLAYLIST_FAILED = errorResult('Failed to edit playlist');
+const DELETE_PLAYLIST_FAILED = errorResult('Failed to delete playlist');
+const ADD_SONGS_TO_PLAYLIST_FAILED = errorResult('Failed to add songs to playlist');
+const REMOVE_SONGS_FROM_PLAYLIST_FAILED = errorResult('Failed to remove songs from playlist');
+
+// Playlists whose tracks are fetched at once when get_playlists includes them
+const PLAYLIST_DETAIL_CONCURRENCY = 4;
+
+// YouTube video IDs are always 11 URL-safe base64 characters
+const VIDEO_ID_PATTERN = /^[A-Za-z0-9_-]{11}$/;
+
 /**
  * Register playlist management tools for full CRUD operations
  */
@@ -16,53 +32,54 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
     'get_playlists',
     {
       title: 'Get Playlists',
-      description: 'Get the user\'s playlists from YouTube Music library. Returns playlist name, ID, and track count as structured JSON.',
+      description: 'Get the user\'s playlists from YouTube Music library. Returns playlist name, ID, and track count as structured JSON. Set include_tracks=true to also fetch each playlist\'s first tracks (title, artist, video ID only) in the same call; use get_playlist_details for full track metadata.',
       inputSchema: {
         limit: z.number().min(1).max(100).default(25).describe('Maximum number of playlists to return'),
+        include_tracks: z.boolean().default(false).describe('If true, also fetch tracks for every returned playlist'),
+        tracks_per_playlist: z.number().min(1).max(200).default(25).describe('Tracks to fetch per playlist when include_tracks is true'),
       },
       annotations: {
         readOnlyHint: true,
         openWorldHint: true,
       },
     },
-    async ({ limit }) => {
-      logger.debug('get_playlists called', { limit });
+    async ({ limit, include_tracks, tracks_per_playlist }) => {
+      logger.debug('get_playlists called', { limit, include_tracks });
 
-      try {
+      return runTool(logger, 'get_playlists', GET_PLAYLISTS_FAILED, async () => {
         const playlists = await context.ytData.getPlaylists(limit);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                playlists: playlists.map(p => ({
-                  id: p.id,
-                  name: p.title,
-                  description: p.description,
-                  privacy: p.privacy,
-                  trackCount: p.videoCount,
-                })),
-                metadata: {
-                  returned: playlists.length,
-                  limit,
-                },
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_playlists failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get playlists' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        // Fetch every playlist's tracks concurrently instead of leaving the
+        // caller to request each one in turn; one failure doesn't fail the rest.
+        // This is an overview, so tracks skip YouTube Music enrichment: with
+        // the defaults that would be 625 tracks and twice as many lookups.
+        const details = include_tracks
+          ? await mapWithConcurrency(playlists, PLAYLIST_DETAIL_CONCURRENCY, async (p) => {
+            try {
+              const { items, nextPageToken } = await context.ytData.getPlaylistItems(p.id, tracks_per_playlist, undefined, false);
+              return { tracks: items, ...(nextPageToken && { nextPageToken }) };
+            } catch (error) {
+              logger.warn('Failed to get tracks for playlist', { playlistId: p.id, error });
+              return { tracksError: 'Failed to get playlist tracks' };
+            }
+          })
+          : undefined;
+
+        return jsonResult({
+          playlists: playlists.map((p, i) => ({
+            id: p.id,
+            name: p.title,
+            description: p.description,
+            privacy: p.privacy,
+            trackCount: p.videoCount,
+            ...details?.[i],
+          })),
+          metadata: {
+            returned: playlists.length,
+            limit,
+          },
+        });
+      });
     }
   );
 
@@ -73,53 +90,41 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
     'get_playlist_details',
     {
       title: 'Get Playlist Details',
-      description: 'Get detailed playlist information including tracks with song, album, artist, and duration. Supports pagination to fetch all tracks. Set fetch_all=true to retrieve entire playlist regardless of size.',
+      description: 'Get detailed playlist information including tracks with song, album, artist, and duration. Returns up to limit tracks and a nextPageToken while more remain; pass it back as page_token to continue. Set fetch_all=true to retrieve entire playlist regardless of size.',
       inputSchema: {
         playlist_id: z.string().describe('Playlist ID'),
         limit: z.number().min(1).max(5000).default(200).describe('Maximum number of tracks to return (up to 5000)'),
         fetch_all: z.boolean().default(false).describe('If true, fetches ALL tracks in the playlist (ignores limit)'),
+        page_token: z.string().optional().describe('nextPageToken from a previous call, to continue where it left off'),
       },
       annotations: {
         readOnlyHint: true,
         openWorldHint: true,
       },
     },
-    async ({ playlist_id, limit, fetch_all }) => {
-      logger.debug('get_playlist_details called', { playlist_id, limit, fetch_all });
+    async ({ playlist_id, limit, fetch_all, page_token }) => {
+      logger.debug('get_playlist_details called', { playlist_id, limit, fetch_all, page_token });
 
-      try {
+      return runTool(logger, 'get_playlist_details', GET_PLAYLIST_DETAILS_FAILED, async () => {
         // If fetch_all is true, use a very high limit to get everything
         const effectiveLimit = fetch_all ? 10000 : limit;
-        const items = await context.ytData.getPlaylistItems(playlist_id, effectiveLimit);
+        const { items, nextPageToken } = await context.ytData.getPlaylistItems(
+          playlist_id,
+          effectiveLimit,
+          page_token
+        );
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                playlistId: playlist_id,
-                tracks: items,
-                metadata: {
-                  returned: items.length,
-                  limit: fetch_all ? 'all' : limit,
-                  fetchedAll: fetch_all,
-                },
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_playlist_details failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get playlist details' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          playlistId: playlist_id,
+          tracks: items,
+          ...(nextPageToken && { nextPageToken }),
+          metadata: {
+            returned: items.length,
+            limit: fetch_all ? 'all' : limit,
+            fetchedAll: fetch_all,
+          },
+        });
+      });
     }
   );
 
@@ -145,37 +150,19 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
     async ({ name, description, privacy }) => {
       logger.debug('create_playlist called', { name, privacy });
 
-      try {
+      return runTool(logger, 'create_playlist', CREATE_PLAYLIST_FAILED, async () => {
         const playlistId = await context.ytData.createPlaylist(
           name,
           description,
           privacy.toLowerCase() as 'private' | 'public' | 'unlisted'
         );
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                success: true,
-                playlistId,
-                message: `Playlist "${name}" created successfully`,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('create_playlist failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to create playlist' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          success: true,
+          playlistId,
+          message: `Playlist "${name}" created successfully`,
+        });
+      });
     }
   );
 
@@ -203,37 +190,19 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
     async ({ playlist_id, name, description, privacy }) => {
       logger.debug('edit_playlist called', { playlist_id, name, privacy });
 
-      try {
+      return runTool(logger, 'edit_playlist', EDIT_PLAYLIST_FAILED, async () => {
         await context.ytData.updatePlaylist(playlist_id, {
           title: name,
           description,
           privacy: privacy?.toLowerCase() as 'private' | 'public' | 'unlisted' | undefined,
         });
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                success: true,
-                playlistId: playlist_id,
-                message: 'Playlist updated successfully',
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('edit_playlist failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to edit playlist' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          success: true,
+          playlistId: playlist_id,
+          message: 'Playlist updated successfully',
+        });
+      });
     }
   );
 
@@ -257,32 +226,14 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
     async ({ playlist_id }) => {
       logger.debug('delete_playlist called', { playlist_id });
 
-      try {
+      return runTool(logger, 'delete_playlist', DELETE_PLAYLIST_FAILED, async () => {
         await context.ytData.deletePlaylist(playlist_id);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                success: true,
-                message: 'Playlist deleted successfully',
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('delete_playlist failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to delete playlist' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          success: true,
+          message: 'Playlist deleted successfully',
+        });
+      });
     }
   );
 
@@ -310,34 +261,39 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
         count: video_ids.length,
       });
 
-      try {
-        await context.ytData.addToPlaylist(playlist_id, video_ids);
+      return runTool(logger, 'add_songs_to_playlist', ADD_SONGS_TO_PLAYLIST_FAILED, async () => {
+        // Search-and-add loops often surface the same song more than once;
+        // a Set keeps first-seen order and spares the repeat inserts
+        const uniqueIds = [...new Set(video_ids)];
+        const duplicatesRemoved = video_ids.length - uniqueIds.length;
+        if (duplicatesRemoved > 0) {
+          logger.debug('Dropped duplicate video IDs', { playlist_id, duplicatesRemoved });
+        }
+
+        // Malformed IDs can only come back as 400s, so they're rejected
+        // here instead of each spending a rate-limited insert
+        const validIds: string[] = [];
+        const invalidIds: string[] = [];
+        for (const id of uniqueIds) {
+          (VIDEO_ID_PATTERN.test(id) ? validIds : invalidIds).push(id);
+        }
+
+        if (validIds.length === 0) {
+          return errorResult('No valid video IDs provided', { invalidIds });
+        }
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                success: true,
-                playlistId: playlist_id,
-                addedCount: video_ids.length,
-                message: `Added ${video_ids.length} song(s) to playlist`,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('add_songs_to_playlist failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to add songs to playlist' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        const { added, failed } = await context.ytData.addToPlaylist(playlist_id, validIds);
+
+        return jsonResult({
+          success: true,
+          playlistId: playlist_id,
+          addedCount: added,
+          ...(failed.length > 0 && { failed }),
+          ...(invalidIds.length > 0 && { invalidIds }),
+          ...(duplicatesRemoved > 0 && { duplicatesRemoved }),
+          message: `Added ${added} of ${uniqueIds.length} song(s) to playlist`,
+        });
+      });
     }
   );
 
@@ -365,34 +321,17 @@ export function registerPlaylistTools(server: McpServer, context: ServerContext)
         count: set_video_ids.length,
       });
 
-      try {
-        await context.ytData.removeFromPlaylist(set_video_ids);
+      return runTool(logger, 'remove_songs_from_playlist', REMOVE_SONGS_FROM_PLAYLIST_FAILED, async () => {
+        const { removed, failed } = await context.ytData.removeFromPlaylist(set_video_ids);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                success: true,
-                playlistId: playlist_id,
-                removedCount: set_video_ids.length,
-                message: `Removed ${set_video_ids.length} song(s) from playlist`,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('remove_songs_from_playlist failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to remove songs from playlist' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          success: true,
+          playlistId: playlist_id,
+          removedCount: removed,
+          ...(failed.length > 0 && { failed }),
+          message: `Removed ${removed} of ${set_video_ids.length} song(s) from playlist`,
+        });
+      });
     }
   );
 
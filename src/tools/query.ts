@@ -2,9 +2,63 @@ import { McpServer } from '@modelcontextprotocol/sdk/server/mcp.js';
 import { z } from 'zod';
 import type { ServerContext } from '../server.js';
 import { createLogger } from '../utils/logger.js';
+import { jsonResult, errorResult, runTool } from './response.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import type { Song } from '../types/index.js';
 
 const logger = createLogger('query-tools');
 
+const SEARCH_SONGS_FAILED = errorResult('Failed to search songs');
+const SEARCH_SONGS_BATCH_FAILED = errorResult('Failed to run batch song search');
+const SEARCH_ALBUMS_FAILED = errorResult('Failed to search albums');
+const SEARCH_ARTISTS_FAILED = errorResult('Failed to search artists');
+const GET_SONG_INFO_FAILED = errorResult('Failed to get song info');
+const GET_ALBUM_INFO_FAILED = errorResult('Failed to get album info');
+const GET_ARTIST_INFO_FAILED = errorResult('Failed to get artist info');
+const GET_LIBRARY_SONGS_FAILED = errorResult('Failed to get library songs');
+
+// Searches from one batch call in flight at once
+const SEARCH_BATCH_CONCURRENCY = 8;
+
+// Song fields a caller can project search results down to
+const SONG_FIELDS = [
+  'videoId',
+  'title',
+  'artists',
+  'album',
+  'duration',
+  'durationSeconds',
+  'thumbnails',
+  'explicit',
+  'year',
+] as const;
+type SongField = typeof SONG_FIELDS[number];
+
+// Enough to pick a match and add it to a playlist; the default projection
+// for every song search
+const DEFAULT_SONG_FIELDS: readonly SongField[] = ['videoId', 'title', 'artists'];
+
+// 'all' opts in to every field
+const fieldsSchema = z.array(z.enum([...SONG_FIELDS, 'all'])).min(1).optional();
+
+/**
+ * Keep only the requested fields of each song; all fields if 'all' is given
+ */
+function projectSongs(songs: Song[], fields: readonly (SongField | 'all')[]): Array<Record<string, unknown>> {
+  if (fields.includes('all')) {
+    return songs;
+  }
+  return songs.map(song => {
+    const projected: Record<string, unknown> = {};
+    for (const field of fields as readonly SongField[]) {
+      if (song[field] !== undefined) {
+        projected[field] = song[field];
+      }
+    }
+    return projected;
+  });
+}
+
 /**
  * Register query tools for searching and retrieving music data
  */
@@ -16,48 +70,79 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     'search_songs',
     {
       title: 'Search Songs',
-      description: 'Search for songs on YouTube Music. Returns structured JSON with song title, album, artist, year, and video ID.',
+      description: 'Search for songs on YouTube Music. Returns structured JSON with video ID, title, and artists by default; pass fields to choose others (e.g. album, year), or ["all"] for every field.',
       inputSchema: {
         query: z.string().describe('Search query (song name, lyrics, etc.)'),
         limit: z.number().min(1).max(50).default(20).describe('Maximum number of results to return'),
+        fields: fieldsSchema.describe('Song fields to return, or ["all"] (default: videoId, title, artists)'),
       },
       annotations: {
         readOnlyHint: true,
         openWorldHint: true,
       },
     },
-    async ({ query, limit }) => {
+    async ({ query, limit, fields = DEFAULT_SONG_FIELDS }) => {
       logger.debug('search_songs called', { query, limit });
 
-      try {
+      return runTool(logger, 'search_songs', SEARCH_SONGS_FAILED, async () => {
         const result = await context.ytMusic.search(query, {
           filter: 'songs',
           limit,
         });
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                songs: result.songs ?? [],
-                metadata: result.metadata,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('search_songs failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to search songs' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          songs: projectSongs(result.songs ?? [], fields),
+          metadata: result.metadata,
+        });
+      });
+    }
+  );
+
+  /**
+   * Search for many songs in one call
+   */
+  server.registerTool(
+    'search_songs_batch',
+    {
+      title: 'Search Songs (Batch)',
+      description: 'Search for several specific songs at once, e.g. every track of a planned playlist. Prefer this over repeated search_songs calls. Returns one result set per query, in query order.',
+      inputSchema: {
+        queries: z.array(z.string()).min(1).max(50).describe('Search queries, one per song (e.g. "Bohemian Rhapsody Queen")'),
+        limit: z.number().min(1).max(20).default(5).describe('Maximum number of results per query'),
+        fields: fieldsSchema.describe('Song fields to return, or ["all"] (default: videoId, title, artists)'),
+      },
+      annotations: {
+        readOnlyHint: true,
+        openWorldHint: true,
+      },
+    },
+    async ({ queries, limit, fields = DEFAULT_SONG_FIELDS }) => {
+      logger.debug('search_songs_batch called', { count: queries.length, limit });
+
+      return runTool(logger, 'search_songs_batch', SEARCH_SONGS_BATCH_FAILED, async () => {
+        // Queries run concurrently; repeats are served by the search cache
+        // or share the in-flight request, and one failure doesn't fail the rest
+        const results = await mapWithConcurrency(queries, SEARCH_BATCH_CONCURRENCY, async (query) => {
+          try {
+            const result = await context.ytMusic.search(query, {
+              filter: 'songs',
+              limit,
+            });
+            return { query, songs: projectSongs(result.songs ?? [], fields) };
+          } catch (error) {
+            logger.warn('Batch search query failed', { query, error });
+            return { query, error: 'Search failed' };
+          }
+        });
+
+        return jsonResult({
+          results,
+          metadata: {
+            queries: queries.length,
+            limit,
+          },
+        });
+      });
     }
   );
 
@@ -81,35 +166,17 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     async ({ query, limit }) => {
       logger.debug('search_albums called', { query, limit });
 
-      try {
+      return runTool(logger, 'search_albums', SEARCH_ALBUMS_FAILED, async () => {
         const result = await context.ytMusic.search(query, {
           filter: 'albums',
           limit,
         });
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                albums: result.albums ?? [],
-                metadata: result.metadata,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('search_albums failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to search albums' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          albums: result.albums ?? [],
+          metadata: result.metadata,
+        });
+      });
     }
   );
 
@@ -133,35 +200,17 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     async ({ query, limit }) => {
       logger.debug('search_artists called', { query, limit });
 
-      try {
+      return runTool(logger, 'search_artists', SEARCH_ARTISTS_FAILED, async () => {
         const result = await context.ytMusic.search(query, {
           filter: 'artists',
           limit,
         });
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                artists: result.artists ?? [],
-                metadata: result.metadata,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('search_artists failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to search artists' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          artists: result.artists ?? [],
+          metadata: result.metadata,
+        });
+      });
     }
   );
 
@@ -184,29 +233,11 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     async ({ video_id }) => {
       logger.debug('get_song_info called', { video_id });
 
-      try {
+      return runTool(logger, 'get_song_info', GET_SONG_INFO_FAILED, async () => {
         const song = await context.ytMusic.getSong(video_id);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ song }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_song_info failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get song info' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({ song });
+      });
     }
   );
 
@@ -229,29 +260,11 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     async ({ browse_id }) => {
       logger.debug('get_album_info called', { browse_id });
 
-      try {
+      return runTool(logger, 'get_album_info', GET_ALBUM_INFO_FAILED, async () => {
         const album = await context.ytMusic.getAlbum(browse_id);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ album }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_album_info failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get album info' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({ album });
+      });
     }
   );
 
@@ -274,29 +287,11 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     async ({ browse_id }) => {
       logger.debug('get_artist_info called', { browse_id });
 
-      try {
+      return runTool(logger, 'get_artist_info', GET_ARTIST_INFO_FAILED, async () => {
         const artist = await context.ytMusic.getArtist(browse_id);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ artist }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_artist_info failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get artist info' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({ artist });
+      });
     }
   );
 
@@ -319,35 +314,17 @@ export function registerQueryTools(server: McpServer, context: ServerContext): v
     async ({ limit }) => {
       logger.debug('get_library_songs called', { limit });
 
-      try {
+      return runTool(logger, 'get_library_songs', GET_LIBRARY_SONGS_FAILED, async () => {
         const songs = await context.ytData.getLikedVideos(limit);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                songs,
-                metadata: {
-                  returned: songs.length,
-                  limit,
-                },
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_library_songs failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get library songs' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          songs,
+          metadata: {
+            returned: songs.length,
+            limit,
+          },
+        });
+      });
     }
   );
 
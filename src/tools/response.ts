@@ -0,0 +1,69 @@
+import type { CallToolResult } from '@modelcontextprotocol/sdk/types.js';
+import type { Logger } from 'winston';
+import { RateLimitedError } from '../utils/rate-limiter.js';
+
+/**
+ * Shared builders for MCP tool results
+ * Both return the SDK's CallToolResult, so every tool has the same typed
+ * response surface and a malformed result fails at compile time
+ */
+
+/**
+ * Wrap a payload as a successful JSON tool result
+ * Serialized compactly: indentation only costs encode time and bytes,
+ * and a large track list grows by roughly a third when pretty-printed
+ */
+export function jsonResult(payload: unknown): CallToolResult {
+  return {
+    content: [
+      {
+        type: 'text',
+        text: JSON.stringify(payload),
+      },
+    ],
+  };
+}
+
+/**
+ * Build a JSON error tool result
+ */
+export function errorResult(message: string, details?: Record<string, unknown>): CallToolResult {
+  return {
+    content: [
+      {
+        type: 'text',
+        text: JSON.stringify({ error: message, ...details }),
+      },
+    ],
+    isError: true,
+  };
+}
+
+/**
+ * Run a tool body, logging any thrown error and returning a prebuilt
+ * error result in its place
+ * Tools build their failure results once, at module load, and every
+ * failure returns that same object
+ * A client-side rate limit is reported as such, with the retry delay, so
+ * the caller can back off instead of seeing a generic failure
+ */
+export async function runTool(
+  logger: Logger,
+  tool: string,
+  failure: CallToolResult,
+  body: () => Promise<CallToolResult>
+): Promise<CallToolResult> {
+  try {
+    return await body();
+  } catch (error) {
+    if (error instanceof RateLimitedError) {
+      logger.warn(`${tool} rate limited`, { retryAfterMs: error.retryAfterMs });
+      return errorResult(error.message, {
+        kind: 'rate_limited',
+        retryAfterSeconds: Math.ceil(error.retryAfterMs / 1000),
+      });
+    }
+    logger.error(`${tool} failed`, { error });
+    return failure;
+  }
+}
@@ -3,10 +3,23 @@ import type { ServerContext } from '../server.js';
 import { createLogger } from '../utils/logger.js';
 import { config } from '../config.js';
 import { tokenStore } from '../auth/token-store.js';
+import { jsonResult, errorResult, runTool } from './response.js';
 
 const logger = createLogger('system-tools');
 
-const startTime = Date.now();
+const GET_AUTH_STATUS_FAILED = errorResult('Failed to get auth status');
+const GET_SERVER_STATUS_FAILED = errorResult('Failed to get server status', { status: 'error' });
+
+// Monotonic, so uptime can't jump or go negative on wall-clock adjustments
+const startTime = performance.now();
+
+// Bypass status never changes, so its result is serialized once
+const BYPASS_AUTH_RESULT = jsonResult({
+  authenticated: true,
+  sessionActive: true,
+  bypassMode: true,
+  instructions: 'Authentication bypass is enabled. All tools are available.',
+});
 
 /**
  * Register system tools for auth status and server health
@@ -28,60 +41,31 @@ export function registerSystemTools(server: McpServer, context: ServerContext):
     async () => {
       logger.debug('get_auth_status called');
 
-      try {
-        const sessionId = tokenStore.getCurrentSessionId();
-        const hasSession = tokenStore.hasActiveSession();
-        const token = tokenStore.getCurrentToken();
-        const needsRefresh = sessionId ? tokenStore.needsRefresh(sessionId) : false;
-
-        // For bypass mode
+      return runTool(logger, 'get_auth_status', GET_AUTH_STATUS_FAILED, async () => {
+        // Bypass mode never consults the token store
         if (config.bypassAuth) {
-          return {
-            content: [
-              {
-                type: 'text',
-                text: JSON.stringify({
-                  authenticated: true,
-                  sessionActive: true,
-                  bypassMode: true,
-                  instructions: 'Authentication bypass is enabled. All tools are available.',
-                }, null, 2),
-              },
-            ],
-          };
+          return BYPASS_AUTH_RESULT;
         }
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                authenticated: hasSession,
-                sessionActive: sessionId !== null,
-                expiresAt: token?.expiresAt
-                  ? new Date(token.expiresAt).toISOString()
-                  : undefined,
-                needsRefresh,
-                bypassMode: config.bypassAuth,
-                instructions: hasSession
-                  ? 'Session is active. You can now use all YouTube Music tools.'
-                  : 'Authentication required. OAuth is managed by Smithery - use the Smithery client to authenticate.',
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_auth_status failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({ error: 'Failed to get auth status' }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        // Refresh state is only looked up when there is a token to refresh
+        const sessionId = tokenStore.getCurrentSessionId();
+        const token = tokenStore.getCurrentToken();
+        const hasSession = token !== undefined;
+        const needsRefresh = hasSession && tokenStore.needsRefresh();
+
+        return jsonResult({
+          authenticated: hasSession,
+          sessionActive: sessionId !== null,
+          expiresAt: token?.expiresAt
+            ? new Date(token.expiresAt).toISOString()
+            : undefined,
+          needsRefresh,
+          bypassMode: config.bypassAuth,
+          instructions: hasSession
+            ? 'Session is active. You can now use all YouTube Music tools.'
+            : 'Authentication required. OAuth is managed by Smithery - use the Smithery client to authenticate.',
+        });
+      });
     }
   );
 
@@ -92,7 +76,7 @@ export function registerSystemTools(server: McpServer, context: ServerContext):
     'get_server_status',
     {
       title: 'Get Server Status',
-      description: 'Get server health, version, and uptime.',
+      description: 'Get server health, version, uptime, and remaining API rate limits.',
       inputSchema: {},
       annotations: {
         readOnlyHint: true,
@@ -101,45 +85,33 @@ export function registerSystemTools(server: McpServer, context: ServerContext):
     async () => {
       logger.debug('get_server_status called');
 
-      try {
-        const uptime = Math.floor((Date.now() - startTime) / 1000);
+      return runTool(logger, 'get_server_status', GET_SERVER_STATUS_FAILED, async () => {
+        const uptime = Math.floor((performance.now() - startTime) / 1000);
+        const health = await context.health.getSnapshot();
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                status: 'healthy',
-                version: '3.0.0',
-                uptime: {
-                  seconds: uptime,
-                  formatted: formatUptime(uptime),
-                },
-                environment: {
-                  nodeEnv: config.nodeEnv,
-                  port: config.port,
-                  bypassAuth: config.bypassAuth,
-                },
-                activeSessions: context.sessions.getActiveSessions().length,
-              }, null, 2),
-            },
-          ],
-        };
-      } catch (error) {
-        logger.error('get_server_status failed', { error });
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify({
-                status: 'error',
-                error: 'Failed to get server status',
-              }),
-            },
-          ],
-          isError: true,
-        };
-      }
+        return jsonResult({
+          status: health.status,
+          version: health.version,
+          checkedAt: health.timestamp,
+          database: health.database,
+          memory: health.memory,
+          uptime: {
+            seconds: uptime,
+            formatted: formatUptime(uptime),
+          },
+          environment: {
+            nodeEnv: config.nodeEnv,
+            port: config.port,
+            bypassAuth: config.bypassAuth,
+          },
+          activeSessions: context.sessions.getActiveSessions().length,
+          // Remaining client-side allowance, so callers can pace bulk work
+          rateLimits: {
+            youtubeMusic: context.ytMusic.getRateLimitStats(),
+            youtubeData: context.ytData.getRateLimitStats(),
+          },
+        });
+      });
     }
   );
 
@@ -0,0 +1,30 @@
+import { createHash } from 'node:crypto';
+
+/**
+ * Hex BLAKE2b digest of value
+ * Both helpers below use this one variant: BLAKE2b is the faster of the two
+ * on 64-bit hosts, and callers only keep a prefix of it.
+ */
+function digest(value: string): string {
+  return createHash('blake2b512').update(value).digest('hex');
+}
+
+/**
+ * Short, stable tag for an identifier that must not appear in logs verbatim
+ * MCP session IDs are bearer-like capabilities: anyone holding one can
+ * drive the session, so logs carry a BLAKE2b digest prefix instead.
+ * 16 hex chars (64 bits) keep tags distinct across any realistic log volume.
+ */
+export function logTag(id: string): string {
+  return digest(id).slice(0, 16);
+}
+
+/**
+ * In-memory cache key for a bearer credential
+ * Caches would otherwise hold every access token verbatim, for as long as
+ * the entry lives. A 128-bit BLAKE2b prefix is collision-free in practice
+ * and cheaper than SHA-256; it only has to be a key, not a MAC.
+ */
+export function secretKey(secret: string): string {
+  return digest(secret).slice(0, 32);
+}
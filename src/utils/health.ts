@@ -0,0 +1,151 @@
+import { createLogger } from './logger.js';
+
+const logger = createLogger('health');
+
+/**
+ * A named health check; resolves to a JSON-serializable status
+ */
+export type HealthCheck = () => Promise<unknown>;
+
+export interface HealthSnapshot {
+  status: 'healthy' | 'degraded';
+  version: string;
+  timestamp: string;
+  // One entry per registered check, keyed by check name
+  [check: string]: unknown;
+}
+
+/**
+ * Report process memory usage in megabytes
+ */
+export async function checkMemoryUsage(): Promise<{ rssMb: number; heapUsedMb: number }> {
+  const { rss, heapUsed } = process.memoryUsage();
+  return {
+    rssMb: Math.round(rss / 1048576),
+    heapUsedMb: Math.round(heapUsed / 1048576),
+  };
+}
+
+/**
+ * Runs health checks on a fixed cadence and serves the last result, so
+ * load balancer polls never trigger checks themselves. A snapshot older
+ * than the TTL (e.g. if the timer stalled) is refreshed on demand.
+ */
+export class HealthMonitor {
+  private snapshot: HealthSnapshot | null = null;
+  // Snapshot serialized once per refresh, so /health polls only write bytes
+  private serialized: string | null = null;
+  // Monotonic time the current snapshot was taken
+  private takenAt = 0;
+  private timer: NodeJS.Timeout | null = null;
+  // Refresh in progress; concurrent callers share it instead of re-running checks
+  private inflight: Promise<HealthSnapshot> | null = null;
+  private readonly version: string;
+  private readonly checks: Array<[string, HealthCheck]>;
+  private readonly ttlMs: number;
+
+  constructor(version: string, checks: Record<string, HealthCheck>, ttlMs: number = 5000) {
+    this.version = version;
+    this.checks = Object.entries(checks);
+    this.ttlMs = ttlMs;
+  }
+
+  /**
+   * Take an initial snapshot and start refreshing in the background
+   */
+  async start(): Promise<void> {
+    await this.refresh();
+
+    this.timer = setInterval(() => {
+      void this.refresh();
+    }, this.ttlMs);
+    // Don't keep the process alive just for health polling
+    this.timer.unref();
+
+    logger.debug('Health monitor started', { ttlMs: this.ttlMs });
+  }
+
+  /**
+   * Stop background refreshes
+   */
+  stop(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /**
+   * Get the latest snapshot, running the checks if it is missing or stale
+   */
+  async getSnapshot(): Promise<HealthSnapshot> {
+    if (this.snapshot && !this.isStale()) {
+      return this.snapshot;
+    }
+    return this.refresh();
+  }
+
+  /**
+   * Get the latest snapshot as a JSON string
+   */
+  async getSerialized(): Promise<string> {
+    if (this.serialized !== null && !this.isStale()) {
+      return this.serialized;
+    }
+    const snapshot = await this.refresh();
+    // Joined refreshes share the string serialized by the one that ran
+    return this.serialized ?? JSON.stringify(snapshot);
+  }
+
+  /**
+   * The timer refreshes every TTL, so a snapshot is only stale once it has
+   * missed a refresh; checking at exactly one TTL would race the timer
+   */
+  private isStale(): boolean {
+    return performance.now() - this.takenAt >= this.ttlMs * 2;
+  }
+
+  /**
+   * Run all checks and replace the cached snapshot
+   * Calls made while a refresh is running join it, so a burst of stale
+   * reads (or a slow check overlapping the next tick) runs the checks once
+   */
+  refresh(): Promise<HealthSnapshot> {
+    this.inflight ??= this.runChecks().finally(() => {
+      this.inflight = null;
+    });
+    return this.inflight;
+  }
+
+  /**
+   * Run all checks concurrently
+   * A failing check is reported in its own entry and marks the snapshot
+   * degraded; it never fails the whole refresh
+   */
+  private async runChecks(): Promise<HealthSnapshot> {
+    const results = await Promise.allSettled(this.checks.map(([, check]) => check()));
+
+    const snapshot: HealthSnapshot = {
+      status: 'healthy',
+      version: this.version,
+      timestamp: new Date().toISOString(),
+    };
+
+    results.forEach((result, i) => {
+      const name = this.checks[i]?.[0] ?? `check${i}`;
+      if (result.status === 'fulfilled') {
+        snapshot[name] = result.value;
+      } else {
+        snapshot.status = 'degraded';
+        const error = result.reason instanceof Error ? result.reason.message : 'Unknown error';
+        snapshot[name] = { healthy: false, error };
+        logger.warn('Health check failed', { check: name, error });
+      }
+    });
+
+    this.snapshot = snapshot;
+    this.serialized = JSON.stringify(snapshot);
+    this.takenAt = performance.now();
+    return snapshot;
+  }
+}
@@ -0,0 +1,15 @@
+import https from 'node:https';
+
+/**
+ * Keep-alive agent shared by the Google API clients (InnerTube and the
+ * YouTube Data API). Node's global agent drops idle sockets after 5s, so
+ * requests a few seconds apart would each pay a fresh TCP + TLS handshake.
+ */
+export const googleAgent = new https.Agent({
+  keepAlive: true,
+  maxSockets: 100,
+  maxFreeSockets: 20,
+  // Idle sockets are kept for a minute before being closed
+  timeout: 60000,
+  scheduling: 'lifo',
+});
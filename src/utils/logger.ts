@@ -9,12 +9,28 @@ const devFormat = printf(({ level, message, timestamp, component, ...metadata })
   return `${timestamp} [${level}] ${component ? `[${component}] ` : ''}${message} ${meta}`;
 });
 
+const level = config.logLevel ?? (config.nodeEnv === 'production' ? 'info' : 'debug');
+const levelPriority = winston.config.npm.levels[level] ?? 0;
+
+// Winston runs the logger's format pipeline before transports apply their
+// level check, so without this below-threshold entries would still be
+// timestamped and serialized only to be discarded. Dropping them first
+// keeps filtered calls cheap.
+const dropBelowLevel = winston.format((info) =>
+  (winston.config.npm.levels[info.level] ?? 0) <= levelPriority ? info : false
+);
+
+// logform's json() defaults to safe-stable-stringify with deterministic
+// (sorted) keys, which sorts every object on every production log line.
+// Insertion order is fine for a log shipper, so skip the sort.
+const prodJson = json({ deterministic: false });
+
 // Create base logger configuration
 const loggerConfig: winston.LoggerOptions = {
-  level: config.nodeEnv === 'production' ? 'info' : 'debug',
+  level,
   format: config.nodeEnv === 'production'
-    ? combine(timestamp(), json())
-    : combine(timestamp({ format: 'HH:mm:ss' }), colorize(), devFormat),
+    ? combine(dropBelowLevel(), timestamp(), prodJson)
+    : combine(dropBelowLevel(), timestamp({ format: 'HH:mm:ss' }), colorize(), devFormat),
   transports: [
     new winston.transports.Console(),
   ],
@@ -8,111 +8,149 @@ interface RateLimiterOptions {
   burstLimit?: number;
 }
 
-interface RequestRecord {
-  timestamp: number;
+/**
+ * A single token bucket; tokens refill continuously up to capacity
+ */
+class TokenBucket {
+  private tokens: number;
+  private lastRefill: number;
+
+  constructor(
+    readonly capacity: number,
+    private readonly refillPerMs: number
+  ) {
+    this.tokens = capacity;
+    this.lastRefill = performance.now();
+  }
+
+  refill(now: number): void {
+    this.tokens = Math.min(this.capacity, this.tokens + (now - this.lastRefill) * this.refillPerMs);
+    this.lastRefill = now;
+  }
+
+  get available(): number {
+    return this.tokens;
+  }
+
+  take(): void {
+    this.tokens -= 1;
+  }
+
+  /**
+   * Milliseconds until one whole token is available
+   */
+  waitTime(): number {
+    return this.tokens >= 1 ? 0 : Math.ceil((1 - this.tokens) / this.refillPerMs);
+  }
+}
+
+/**
+ * Thrown when a caller that must not wait finds the limiter exhausted
+ */
+export class RateLimitedError extends Error {
+  constructor(
+    readonly limiter: string,
+    readonly retryAfterMs: number
+  ) {
+    super(`Rate limit reached for ${limiter}; retry in ${Math.ceil(retryAfterMs / 1000)}s`);
+    this.name = 'RateLimitedError';
+  }
 }
 
+/**
+ * Token-bucket rate limiter. Burst, per-minute and per-hour limits are
+ * separate buckets and a request needs a token from each, so traffic is
+ * smoothed continuously instead of resetting at window boundaries.
+ */
 export class RateLimiter {
-  private readonly requestsPerMinute: number;
-  private readonly requestsPerHour: number;
-  private readonly burstLimit: number;
-  private readonly requests: RequestRecord[] = [];
+  private readonly burst: TokenBucket;
+  private readonly minute: TokenBucket;
+  private readonly hour: TokenBucket;
   private readonly name: string;
 
   constructor(name: string, options: RateLimiterOptions) {
     this.name = name;
-    this.requestsPerMinute = options.requestsPerMinute;
-    this.requestsPerHour = options.requestsPerHour ?? options.requestsPerMinute * 60;
-    this.burstLimit = options.burstLimit ?? 10;
+    const requestsPerHour = options.requestsPerHour ?? options.requestsPerMinute * 60;
+    const burstLimit = options.burstLimit ?? 10;
+
+    // Burst capacity refills over 10 seconds, the others over their window
+    this.burst = new TokenBucket(burstLimit, burstLimit / 10000);
+    this.minute = new TokenBucket(options.requestsPerMinute, options.requestsPerMinute / 60000);
+    this.hour = new TokenBucket(requestsPerHour, requestsPerHour / 3600000);
   }
 
   /**
-   * Check if a request can be made, throws if rate limited
+   * Take a token from every bucket if all of them have one
+   * Returns 0 on success, otherwise the milliseconds until a retry can
+   * succeed (nothing is taken in that case)
    */
-  async acquire(): Promise<void> {
-    const now = Date.now();
-    this.cleanup(now);
-
-    // Check burst limit (last 10 seconds)
-    const burstWindow = now - 10000;
-    const burstCount = this.requests.filter(r => r.timestamp > burstWindow).length;
-    if (burstCount >= this.burstLimit) {
-      const waitTime = this.calculateWaitTime('burst');
-      logger.warn(`Rate limit exceeded (burst)`, {
-        name: this.name,
-        burstCount,
-        waitTime
-      });
-      await this.wait(waitTime);
-    }
-
-    // Check per-minute limit
-    const minuteWindow = now - 60000;
-    const minuteCount = this.requests.filter(r => r.timestamp > minuteWindow).length;
-    if (minuteCount >= this.requestsPerMinute) {
-      const waitTime = this.calculateWaitTime('minute');
-      logger.warn(`Rate limit exceeded (per-minute)`, {
-        name: this.name,
-        minuteCount,
-        waitTime
-      });
-      await this.wait(waitTime);
+  tryAcquire(): number {
+    const now = performance.now();
+    this.burst.refill(now);
+    this.minute.refill(now);
+    this.hour.refill(now);
+
+    const waitTime = Math.max(
+      this.burst.waitTime(),
+      this.minute.waitTime(),
+      this.hour.waitTime()
+    );
+
+    if (waitTime === 0) {
+      this.burst.take();
+      this.minute.take();
+      this.hour.take();
     }
+    return waitTime;
+  }
 
-    // Check per-hour limit
-    const hourWindow = now - 3600000;
-    const hourCount = this.requests.filter(r => r.timestamp > hourWindow).length;
-    if (hourCount >= this.requestsPerHour) {
-      const waitTime = this.calculateWaitTime('hour');
-      logger.warn(`Rate limit exceeded (per-hour)`, {
+  /**
+   * Take a token from every bucket, waiting until all of them have one
+   * Gives up with a RateLimitedError as soon as the wait would run past
+   * maxWaitMs, instead of sleeping first and failing later
+   */
+  async acquire(maxWaitMs: number = Infinity): Promise<void> {
+    const deadline = performance.now() + maxWaitMs;
+    for (;;) {
+      const waitTime = this.tryAcquire();
+      if (waitTime === 0) {
+        return;
+      }
+      if (performance.now() + waitTime > deadline) {
+        throw new RateLimitedError(this.name, waitTime);
+      }
+
+      logger.warn('Rate limit exceeded', {
         name: this.name,
-        hourCount,
-        waitTime
+        waitTime,
       });
       await this.wait(waitTime);
     }
-
-    // Record the request
-    this.requests.push({ timestamp: Date.now() });
   }
 
   /**
    * Get current usage statistics
    */
   getStats() {
-    const now = Date.now();
-    this.cleanup(now);
+    const now = performance.now();
+    this.burst.refill(now);
+    this.minute.refill(now);
+    this.hour.refill(now);
 
     return {
-      lastMinute: this.requests.filter(r => r.timestamp > now - 60000).length,
-      lastHour: this.requests.filter(r => r.timestamp > now - 3600000).length,
+      available: {
+        burst: Math.floor(this.burst.available),
+        perMinute: Math.floor(this.minute.available),
+        perHour: Math.floor(this.hour.available),
+      },
       limits: {
-        perMinute: this.requestsPerMinute,
-        perHour: this.requestsPerHour,
-        burst: this.burstLimit,
+        perMinute: this.minute.capacity,
+        perHour: this.hour.capacity,
+        burst: this.burst.capacity,
       },
     };
   }
 
-  private cleanup(now: number) {
-    // Remove requests older than 1 hour
-    const cutoff = now - 3600000;
-    while (this.requests.length > 0 && (this.requests[0]?.timestamp ?? 0) < cutoff) {
-      this.requests.shift();
-    }
-  }
-
-  private calculateWaitTime(type: 'burst' | 'minute' | 'hour'): number {
-    switch (type) {
-      case 'burst':
-        return 1000; // Wait 1 second
-      case 'minute':
-        return 5000; // Wait 5 seconds
-      case 'hour':
-        return 60000; // Wait 1 minute
-    }
-  }
-
   private wait(ms: number): Promise<void> {
     return new Promise(resolve => setTimeout(resolve, ms));
   }
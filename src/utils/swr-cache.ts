@@ -0,0 +1,77 @@
+import { LRUCache } from 'lru-cache';
+
+/**
+ * One caller's load, plus the error it failed with if it did
+ */
+interface LoadAttempt<V> {
+  load: () => Promise<V>;
+  error?: unknown;
+}
+
+/**
+ * LRU cache with stale-while-revalidate reads
+ * An entry younger than freshMs is served as-is. Between freshMs and
+ * staleMs it is still served immediately while a background load
+ * replaces it. Past staleMs, callers wait for a fresh load. Concurrent
+ * loads of the same key are shared.
+ */
+export class SwrCache<V extends NonNullable<unknown>> {
+  private readonly cache: LRUCache<string, V, LoadAttempt<V>>;
+  private readonly freshMs: number;
+  private readonly staleMs: number;
+
+  constructor(max: number, freshMs: number, staleMs: number) {
+    this.freshMs = freshMs;
+    this.staleMs = staleMs;
+    this.cache = new LRUCache<string, V, LoadAttempt<V>>({
+      max,
+      ttl: freshMs,
+      allowStale: true,
+      // A failed background refresh keeps serving the stale entry
+      allowStaleOnFetchRejection: true,
+      fetchMethod: async (_key, _stale, { context }) => {
+        try {
+          return await context.load();
+        } catch (error) {
+          context.error = error;
+          throw error;
+        }
+      },
+    });
+  }
+
+  /**
+   * Get the value for key, loading it with load when missing or too old
+   */
+  async get(key: string, load: () => Promise<V>): Promise<V> {
+    // Remaining TTL goes negative once an entry is stale; past the stale
+    // window it is dropped so this call waits for fresh data
+    if (this.cache.getRemainingTTL(key) < this.freshMs - this.staleMs) {
+      this.cache.delete(key);
+    }
+
+    const attempt: LoadAttempt<V> = { load };
+    const value = await this.cache.fetch(key, { context: attempt });
+    if (value !== undefined) {
+      return value;
+    }
+
+    // A rejected load with nothing stale to fall back on resolves to
+    // undefined. Surface the real error; a caller that joined someone
+    // else's load has no error of its own, so it retries directly.
+    if ('error' in attempt) {
+      throw attempt.error;
+    }
+    return load();
+  }
+
+  /**
+   * Drop every entry whose key starts with prefix
+   */
+  deletePrefix(prefix: string): void {
+    const keys = [...this.cache.keys()].filter(key => key.startsWith(prefix));
+    for (const key of keys) {
+      this.cache.delete(key);
+    }
+  }
+}
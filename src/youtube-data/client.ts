@@ -1,5 +1,11 @@
 import got, { Got } from 'got';
+import { LRUCache } from 'lru-cache';
 import { createLogger } from '../utils/logger.js';
+import { googleAgent } from '../utils/http.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import { RateLimiter } from '../utils/rate-limiter.js';
+import { SwrCache } from '../utils/swr-cache.js';
+import { secretKey } from '../utils/hash.js';
 import { tokenStore } from '../auth/token-store.js';
 import type { YouTubeMusicClient } from '../youtube-music/client.js';
 
@@ -7,6 +13,102 @@ const logger = createLogger('youtube-data-api');
 
 // YouTube Data API v3 constants
 const YT_DATA_API_BASE = 'https://www.googleapis.com/youtube/v3';
+const NO_ACCESS_TOKEN_MESSAGE = 'No access token available';
+// YouTube Music lookups in flight at once while enriching a track list
+const ENRICHMENT_CONCURRENCY = 8;
+// Enrichment stops starting lookups after this long; later tracks keep
+// their Data API fields, so a long playlist can't hold a tool call past
+// client timeouts or drain the shared InnerTube budget
+const ENRICHMENT_BUDGET_MS = 20 * 1000;
+// videos.list accepts up to 50 IDs per call; this many calls run at once
+const VIDEOS_PER_BATCH = 50;
+const BATCH_CONCURRENCY = 4;
+// Library reads are served from cache for a minute, then served stale
+// while refreshing for up to ten; any write by the user invalidates them
+const LIBRARY_CACHE_MAX = 1000;
+const LIBRARY_CACHE_FRESH_MS = 60 * 1000;
+const LIBRARY_CACHE_STALE_MS = 10 * 60 * 1000;
+// Per-user write limiters; an idle user's buckets are full again within the
+// hour, so dropping them after that loses nothing
+const WRITE_LIMITERS_MAX = 1000;
+const WRITE_LIMITERS_IDLE_MS = 60 * 60 * 1000;
+// Longest a write call waits on its limiter in total; MCP clients commonly
+// time a request out at 60s
+const WRITE_WAIT_BUDGET_MS = 45 * 1000;
+
+/**
+ * Why a single playlist write failed, derived from the API error reason
+ * or the HTTP status
+ */
+export type PlaylistErrorKind =
+  | 'bad_video_id'
+  | 'auth_expired'
+  | 'forbidden'
+  | 'not_found'
+  | 'conflict'
+  | 'rate_limited'
+  | 'unknown';
+
+// One lookup on the status code classifies a failure
+const ERROR_KIND_BY_STATUS: Readonly<Record<number, PlaylistErrorKind>> = {
+  400: 'bad_video_id',
+  401: 'auth_expired',
+  403: 'forbidden',
+  404: 'not_found',
+  409: 'conflict',
+  429: 'rate_limited',
+};
+
+// Quota and rate limits come back as 403s; only the reason tells them
+// apart from a real permission error
+const ERROR_KIND_BY_REASON: Readonly<Record<string, PlaylistErrorKind>> = {
+  quotaExceeded: 'rate_limited',
+  rateLimitExceeded: 'rate_limited',
+  userRateLimitExceeded: 'rate_limited',
+  dailyLimitExceeded: 'rate_limited',
+};
+
+/**
+ * Classify a failed Data API request by its error reason, falling back to
+ * the status code
+ */
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+function classifyApiError(error: any): { kind: PlaylistErrorKind; statusCode?: number; message: string } {
+  const apiError = error?.response?.body?.error;
+  const reason: string | undefined = apiError?.errors?.[0]?.reason;
+  const statusCode: number | undefined = error?.response?.statusCode || apiError?.code;
+  const kind = (reason !== undefined ? ERROR_KIND_BY_REASON[reason] : undefined)
+    ?? (statusCode !== undefined ? ERROR_KIND_BY_STATUS[statusCode] : undefined)
+    ?? 'unknown';
+  return { kind, statusCode, message: apiError?.message || error?.message || 'Unknown error' };
+}
+
+export interface AddToPlaylistResult {
+  added: number;
+  failed: { videoId: string; kind: PlaylistErrorKind; error: string }[];
+}
+
+export interface RemoveFromPlaylistResult {
+  removed: number;
+  failed: { setVideoId: string; kind: PlaylistErrorKind; error: string }[];
+}
+
+/**
+ * A single failed write in a run of item writes
+ */
+interface WriteFailure {
+  id: string;
+  kind: PlaylistErrorKind;
+  error: string;
+}
+
+/**
+ * Write rate limiters for one user
+ */
+interface WriteLimiters {
+  create: RateLimiter;
+  mutate: RateLimiter;
+}
 
 export interface Playlist {
   id: string;
@@ -23,11 +125,31 @@ export interface Playlist {
 export class YouTubeDataClient {
   private client: Got;
   private ytMusicClient?: YouTubeMusicClient;
+  // Writes are paced client-side per user and operation class. Each one
+  // costs 50 quota units, and bursts of them get 429s or a temporary write
+  // lockout. Playlist creation has a much lower ceiling than item edits.
+  private writeLimiters = new LRUCache<string, WriteLimiters>({
+    max: WRITE_LIMITERS_MAX,
+    ttl: WRITE_LIMITERS_IDLE_MS,
+    updateAgeOnGet: true,
+  });
+  // Playlist listings and playlist pages, keyed per user
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  private libraryCache = new SwrCache<any>(
+    LIBRARY_CACHE_MAX,
+    LIBRARY_CACHE_FRESH_MS,
+    LIBRARY_CACHE_STALE_MS
+  );
 
   constructor(ytMusicClient?: YouTubeMusicClient) {
     this.client = got.extend({
       prefixUrl: YT_DATA_API_BASE,
       responseType: 'json',
+      // Cached c-ares lookups keep DNS off the libuv threadpool
+      dnsCache: true,
+      agent: {
+        https: googleAgent,
+      },
       timeout: {
         request: 30000,
       },
@@ -48,53 +170,203 @@ export class YouTubeDataClient {
   }
 
   /**
-   * Get user's playlists (with pagination support)
+   * Build the Authorization header for the current session, throwing if it
+   * has no token. Methods build it once and reuse it across every page,
+   * batch or item they request.
    */
-  async getPlaylists(maxResults: number = 25): Promise<Playlist[]> {
+  private requireAuthHeaders(): { Authorization: string } {
+    const headers = this.currentAuthHeaders();
+    if (!headers) {
+      throw new Error(NO_ACCESS_TOKEN_MESSAGE);
+    }
+    return headers;
+  }
+
+  /**
+   * Authorization header for the current session, if it has a token
+   */
+  private currentAuthHeaders(): { Authorization: string } | null {
     const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
+    return accessToken ? { Authorization: `Bearer ${accessToken}` } : null;
+  }
+
+  /**
+   * Yield items from a paginated list endpoint one page at a time
+   * The next page is only requested once the caller has consumed the
+   * current one, and paging stops as soon as maxResults items are yielded.
+   * The last request asks for just the items still needed, so each page's
+   * nextPageToken resumes exactly after the items yielded so far.
+   */
+  private async *paginate(
+    endpoint: string,
+    searchParams: Record<string, string>,
+    headers: Record<string, string>,
+    maxResults: number,
+    startPageToken?: string
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  ): AsyncGenerator<{ items: any[]; nextPageToken?: string }> {
+    let remaining = maxResults;
+    let pageToken = startPageToken;
+
+    do {
+      const response = await this.client.get(endpoint, {
+        searchParams: {
+          ...searchParams,
+          maxResults: Math.min(remaining, 50), // API max is 50
+          ...(pageToken && { pageToken }),
+        },
+        headers,
+      });
+
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      const data = response.body as any;
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      const items: any[] = data.items || [];
+      pageToken = data.nextPageToken;
+      yield { items, nextPageToken: pageToken };
+
+      remaining -= items.length;
+    } while (pageToken && remaining > 0);
+  }
+
+  /**
+   * Cache key prefix shared by every library entry of the current user
+   */
+  private libraryKey(headers: { Authorization: string }): string {
+    return `${secretKey(headers.Authorization)}|`;
+  }
+
+  /**
+   * Drop the user's cached library reads after a write
+   * Writes made outside this client (e.g. through YouTube Music) must call
+   * this too; without headers the current session's token is used.
+   */
+  invalidateLibrary(headers = this.currentAuthHeaders()): void {
+    if (headers) {
+      this.libraryCache.deletePrefix(this.libraryKey(headers));
     }
+  }
 
-    try {
-      const playlists: Playlist[] = [];
-      let pageToken: string | undefined;
-      const perPage = Math.min(maxResults, 50); // API max is 50
+  /**
+   * The user's write limiters, created on first write
+   */
+  private limitersFor(headers: { Authorization: string }): WriteLimiters {
+    const key = secretKey(headers.Authorization);
+    let limiters = this.writeLimiters.get(key);
+    if (limiters === undefined) {
+      limiters = {
+        create: new RateLimiter('youtube-data-create', {
+          requestsPerMinute: 2,
+          requestsPerHour: 10,
+          burstLimit: 2,
+        }),
+        mutate: new RateLimiter('youtube-data-mutate', {
+          requestsPerMinute: 30,
+          burstLimit: 5,
+        }),
+      };
+      this.writeLimiters.set(key, limiters);
+    }
+    return limiters;
+  }
 
-      do {
-        const response = await this.client.get('playlists', {
-          searchParams: {
-            part: 'snippet,contentDetails,status',
-            mine: 'true',
-            maxResults: perPage,
-            ...(pageToken && { pageToken }),
-          },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
-        });
+  /**
+   * Run one rate-limited write per ID, in order
+   * Each write waits on the user's mutate bucket, within WRITE_WAIT_BUDGET_MS
+   * for the whole run. The run stops early once the budget, the API quota or
+   * the token runs out, marking the rest as skipped. A budget overrun before
+   * anything was written is rethrown so the caller can retry the whole call.
+   */
+  private async writeEach(
+    headers: { Authorization: string },
+    ids: string[],
+    action: string,
+    write: (id: string) => Promise<unknown>
+  ): Promise<{ done: number; failed: WriteFailure[] }> {
+    const { mutate } = this.limitersFor(headers);
+    const deadline = performance.now() + WRITE_WAIT_BUDGET_MS;
+    const failed: WriteFailure[] = [];
+    let done = 0;
+
+    for (let i = 0; i < ids.length; i++) {
+      const id = ids[i] as string;
+      try {
+        await mutate.acquire(deadline - performance.now());
+      } catch (error) {
+        if (done === 0) {
+          throw error;
+        }
+        const reason = error instanceof Error ? error.message : 'rate limit reached';
+        for (const skipped of ids.slice(i)) {
+          failed.push({ id: skipped, kind: 'rate_limited', error: `Skipped: ${reason}` });
+        }
+        break;
+      }
 
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-        const data = response.body as any;
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-        const items = (data.items || []).map((item: any) => ({
-          id: item.id,
-          title: item.snippet.title,
-          description: item.snippet.description || '',
-          privacy: item.status.privacyStatus,
-          videoCount: item.contentDetails.itemCount,
-        }));
-
-        playlists.push(...items);
-        pageToken = data.nextPageToken;
-
-        // Stop if we have enough results
-        if (playlists.length >= maxResults) {
+      try {
+        await write(id);
+        done++;
+        logger.debug(`${action} succeeded`, { id });
+      } catch (error) {
+        const { kind, statusCode, message } = classifyApiError(error);
+        failed.push({ id, kind, error: `${statusCode ? `[${statusCode}] ` : ''}${message}` });
+        logger.warn(`Failed to ${action}`, { id, error: message, statusCode, kind });
+
+        // An expired token or an exhausted quota fails every remaining
+        // write the same way
+        if (kind === 'auth_expired' || kind === 'rate_limited') {
+          const reason = kind === 'auth_expired' ? 'access token rejected' : 'API quota or rate limit reached';
+          for (const skipped of ids.slice(i + 1)) {
+            failed.push({ id: skipped, kind, error: `Skipped: ${reason}` });
+          }
           break;
         }
-      } while (pageToken);
+      }
+    }
+
+    if (failed.length > 0) {
+      logger.warn(`Some writes failed: ${action}`, { failed: failed.length });
+    }
+    return { done, failed };
+  }
+
+  /**
+   * Get user's playlists (with pagination support)
+   */
+  async getPlaylists(maxResults: number = 25): Promise<Playlist[]> {
+    const headers = this.requireAuthHeaders();
+    return this.libraryCache.get(
+      `${this.libraryKey(headers)}playlists|${maxResults}`,
+      () => this.fetchPlaylists(headers, maxResults)
+    );
+  }
 
-      return playlists.slice(0, maxResults);
+  /**
+   * Fetch the user's playlists from the API
+   */
+  private async fetchPlaylists(headers: { Authorization: string }, maxResults: number): Promise<Playlist[]> {
+    try {
+      const playlists: Playlist[] = [];
+      const pages = this.paginate(
+        'playlists',
+        { part: 'snippet,contentDetails,status', mine: 'true' },
+        headers,
+        maxResults
+      );
+
+      for await (const page of pages) {
+        for (const item of page.items) {
+          playlists.push({
+            id: item.id,
+            title: item.snippet.title,
+            description: item.snippet.description || '',
+            privacy: item.status.privacyStatus,
+            videoCount: item.contentDetails.itemCount,
+          });
+        }
+      }
+
+      return playlists;
     } catch (error) {
       logger.error('Failed to get playlists', {
         error: error instanceof Error ? error.message : 'Unknown error',
@@ -111,20 +383,16 @@ export class YouTubeDataClient {
     description: string = '',
     privacy: 'private' | 'public' | 'unlisted' = 'private'
   ): Promise<string> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const headers = this.requireAuthHeaders();
 
     try {
+      // Creates are single-shot and scarce: fail fast with the retry delay
+      await this.limitersFor(headers).create.acquire(0);
       const response = await this.client.post('playlists', {
         searchParams: {
           part: 'snippet,status',
         },
-        headers: {
-          Authorization: `Bearer ${accessToken}`,
-          'Content-Type': 'application/json',
-        },
+        headers,
         json: {
           snippet: {
             title,
@@ -145,6 +413,8 @@ export class YouTubeDataClient {
         error: error instanceof Error ? error.message : 'Unknown error',
       });
       throw error;
+    } finally {
+      this.invalidateLibrary(headers);
     }
   }
 
@@ -152,19 +422,16 @@ export class YouTubeDataClient {
    * Delete a playlist
    */
   async deletePlaylist(playlistId: string): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const headers = this.requireAuthHeaders();
+    const { mutate } = this.limitersFor(headers);
 
     try {
+      await mutate.acquire(WRITE_WAIT_BUDGET_MS);
       await this.client.delete('playlists', {
         searchParams: {
           id: playlistId,
         },
-        headers: {
-          Authorization: `Bearer ${accessToken}`,
-        },
+        headers,
       });
 
       logger.info('Playlist deleted', { playlistId });
@@ -173,6 +440,8 @@ export class YouTubeDataClient {
         error: error instanceof Error ? error.message : 'Unknown error',
       });
       throw error;
+    } finally {
+      this.invalidateLibrary(headers);
     }
   }
 
@@ -187,10 +456,8 @@ export class YouTubeDataClient {
       privacy?: 'private' | 'public' | 'unlisted';
     }
   ): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const headers = this.requireAuthHeaders();
+    const { mutate } = this.limitersFor(headers);
 
     try {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -204,14 +471,12 @@ export class YouTubeDataClient {
       if (updates.description !== undefined) body.snippet.description = updates.description;
       if (updates.privacy) body.status.privacyStatus = updates.privacy;
 
+      await mutate.acquire(WRITE_WAIT_BUDGET_MS);
       await this.client.put('playlists', {
         searchParams: {
           part: 'snippet,status',
         },
-        headers: {
-          Authorization: `Bearer ${accessToken}`,
-          'Content-Type': 'application/json',
-        },
+        headers,
         json: body,
       });
 
@@ -221,184 +486,159 @@ export class YouTubeDataClient {
         error: error instanceof Error ? error.message : 'Unknown error',
       });
       throw error;
+    } finally {
+      this.invalidateLibrary(headers);
     }
   }
 
   /**
    * Add videos to playlist
+   * Returns per-video failures on partial success; throws if none were added
    */
-  async addToPlaylist(playlistId: string, videoIds: string[]): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
-
-    const results: { videoId: string; success: boolean; error?: string }[] = [];
-    let successCount = 0;
-    let failureCount = 0;
-
-    for (const videoId of videoIds) {
-      try {
-        await this.client.post('playlistItems', {
-          searchParams: {
-            part: 'snippet',
-          },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-            'Content-Type': 'application/json',
-          },
-          json: {
-            snippet: {
-              playlistId,
-              resourceId: {
-                kind: 'youtube#video',
-                videoId,
-              },
+  async addToPlaylist(playlistId: string, videoIds: string[]): Promise<AddToPlaylistResult> {
+    const headers = this.requireAuthHeaders();
+
+    // The Data API has no bulk insert, and concurrent inserts into one
+    // playlist race on position (and get 409s), so items go in one at a
+    // time. Everything but the video ID is shared across the loop.
+    const searchParams = { part: 'snippet' };
+
+    const { done: added, failed } = await this.writeEach(headers, videoIds, 'add video to playlist', videoId =>
+      this.client.post('playlistItems', {
+        searchParams,
+        headers,
+        json: {
+          snippet: {
+            playlistId,
+            resourceId: {
+              kind: 'youtube#video',
+              videoId,
             },
           },
-        });
-
-        results.push({ videoId, success: true });
-        successCount++;
-        logger.debug('Video added to playlist', { playlistId, videoId });
-      // eslint-disable-next-line @typescript-eslint/no-explicit-any
-      } catch (error: any) {
-        failureCount++;
-        const errorMessage = error?.response?.body?.error?.message ||
-                           error?.message ||
-                           'Unknown error';
-        const errorCode = error?.response?.statusCode ||
-                         error?.response?.body?.error?.code;
-
-        results.push({
-          videoId,
-          success: false,
-          error: `${errorCode ? `[${errorCode}] ` : ''}${errorMessage}`
-        });
-
-        logger.warn('Failed to add video to playlist', {
-          playlistId,
-          videoId,
-          error: errorMessage,
-          statusCode: errorCode,
-        });
-      }
-    }
+        },
+      })
+    ).finally(() => this.invalidateLibrary(headers));
 
     logger.info('Batch add to playlist completed', {
       playlistId,
       total: videoIds.length,
-      success: successCount,
-      failed: failureCount,
+      success: added,
+      failed: failed.length,
     });
 
     // If all videos failed, throw an error
-    if (failureCount === videoIds.length) {
-      const errorDetails = results.map(r => `${r.videoId}: ${r.error}`).join('; ');
+    if (added === 0) {
+      const errorDetails = failed.map(r => `${r.id}: ${r.error}`).join('; ');
       throw new Error(`Failed to add any videos to playlist: ${errorDetails}`);
     }
 
-    // If some failed, log warning but don't throw (partial success)
-    if (failureCount > 0) {
-      logger.warn('Some videos failed to add', {
-        failedVideos: results.filter(r => !r.success),
-      });
-    }
+    return {
+      added,
+      failed: failed.map(({ id, kind, error }) => ({ videoId: id, kind, error })),
+    };
   }
 
   /**
    * Remove videos from playlist
+   * Returns per-item failures on partial success; throws if none were removed
    */
-  async removeFromPlaylist(playlistItemIds: string[]): Promise<void> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
-
-    try {
-      for (const itemId of playlistItemIds) {
-        await this.client.delete('playlistItems', {
-          searchParams: {
-            id: itemId,
-          },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
-        });
-      }
+  async removeFromPlaylist(playlistItemIds: string[]): Promise<RemoveFromPlaylistResult> {
+    const headers = this.requireAuthHeaders();
+
+    const { done: removed, failed } = await this.writeEach(headers, playlistItemIds, 'remove video from playlist', id =>
+      this.client.delete('playlistItems', {
+        searchParams: { id },
+        headers,
+      })
+    ).finally(() => this.invalidateLibrary(headers));
+
+    logger.info('Videos removed from playlist', {
+      total: playlistItemIds.length,
+      success: removed,
+      failed: failed.length,
+    });
 
-      logger.info('Videos removed from playlist', {
-        count: playlistItemIds.length,
-      });
-    } catch (error) {
-      logger.error('Failed to remove videos from playlist', {
-        error: error instanceof Error ? error.message : 'Unknown error',
-      });
-      throw error;
+    if (removed === 0) {
+      const errorDetails = failed.map(r => `${r.id}: ${r.error}`).join('; ');
+      throw new Error(`Failed to remove any videos from playlist: ${errorDetails}`);
     }
+
+    return {
+      removed,
+      failed: failed.map(({ id, kind, error }) => ({ setVideoId: id, kind, error })),
+    };
   }
 
   /**
    * Get playlist items (songs in a playlist) with pagination and enrichment
+   * Starts at pageToken when given; nextPageToken is set while more remain.
+   * With enrich false, items carry only Data API fields and no YouTube Music
+   * lookups are made.
    */
-  // eslint-disable-next-line @typescript-eslint/no-explicit-any
-  async getPlaylistItems(playlistId: string, maxResults: number = 50): Promise<any[]> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+  async getPlaylistItems(
+    playlistId: string,
+    maxResults: number = 50,
+    pageToken?: string,
+    enrich: boolean = true
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  ): Promise<{ items: any[]; nextPageToken?: string }> {
+    const headers = this.requireAuthHeaders();
+    return this.libraryCache.get(
+      `${this.libraryKey(headers)}items|${playlistId}|${maxResults}|${pageToken ?? ''}|${enrich ? 'full' : 'basic'}`,
+      () => this.fetchPlaylistItems(headers, playlistId, maxResults, pageToken, enrich)
+    );
+  }
 
+  /**
+   * Fetch and enrich one run of playlist items from the API
+   */
+  private async fetchPlaylistItems(
+    headers: { Authorization: string },
+    playlistId: string,
+    maxResults: number,
+    pageToken: string | undefined,
+    enrich: boolean
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  ): Promise<{ items: any[]; nextPageToken?: string }> {
     try {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
       const items: any[] = [];
-      let pageToken: string | undefined;
-      const perPage = Math.min(maxResults, 50); // API max is 50
-
-      do {
-        const response = await this.client.get('playlistItems', {
-          searchParams: {
-            part: 'snippet,contentDetails',
-            playlistId,
-            maxResults: perPage,
-            ...(pageToken && { pageToken }),
-          },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
-        });
-
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-        const data = response.body as any;
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-        const pageItems = (data.items || []).map((item: any) => ({
-          playlistItemId: item.id,
-          videoId: item.contentDetails.videoId,
-          title: item.snippet.title,
-          artist: item.snippet.videoOwnerChannelTitle || item.snippet.channelTitle,
-          position: item.snippet.position,
-          thumbnails: item.snippet.thumbnails || {},
-        }));
-
-        items.push(...pageItems);
-        pageToken = data.nextPageToken;
-
-        // Stop if we have enough results
-        if (items.length >= maxResults) {
-          break;
+      let nextPageToken: string | undefined;
+      const pages = this.paginate(
+        'playlistItems',
+        { part: 'snippet,contentDetails', playlistId },
+        headers,
+        maxResults,
+        pageToken
+      );
+
+      // Keep only the fields we return, so raw API pages can be dropped as
+      // soon as they are consumed
+      for await (const page of pages) {
+        nextPageToken = page.nextPageToken;
+        for (const item of page.items) {
+          items.push({
+            playlistItemId: item.id,
+            videoId: item.contentDetails.videoId,
+            title: item.snippet.title,
+            artist: item.snippet.videoOwnerChannelTitle || item.snippet.channelTitle,
+            position: item.snippet.position,
+          });
         }
-      } while (pageToken);
+      }
 
-      const finalItems = items.slice(0, maxResults);
+      if (!enrich) {
+        return { items, nextPageToken };
+      }
 
       // Enrich with video details (duration, etc.)
-      const videoIds = finalItems.map(item => item.videoId);
+      const videoIds = items.map(item => item.videoId);
       const enrichedData = await this.enrichVideoData(videoIds);
 
-      return finalItems.map(item => {
+      const enrichedItems = items.map(item => {
         const enrichment = enrichedData.get(item.videoId);
-        const { thumbnails: _thumbnails, ...itemWithoutThumbnails } = item;
         return this.cleanObject({
-          ...itemWithoutThumbnails,
+          ...item,
           duration: enrichment ? this.formatDuration(enrichment.durationSeconds) : undefined,
           durationSeconds: enrichment?.durationSeconds,
           album: enrichment?.album,
@@ -407,6 +647,8 @@ export class YouTubeDataClient {
           explicit: enrichment?.explicit,
         });
       });
+
+      return { items: enrichedItems, nextPageToken };
     } catch (error) {
       logger.error('Failed to get playlist items', {
         error: error instanceof Error ? error.message : 'Unknown error',
@@ -425,23 +667,26 @@ export class YouTubeDataClient {
     if (!accessToken || videoIds.length === 0) {
       return new Map();
     }
+    const headers = { Authorization: `Bearer ${accessToken}` };
 
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     const enrichedData = new Map<string, any>();
 
-    // First get duration from YouTube Data API in batches of 50
-    for (let i = 0; i < videoIds.length; i += 50) {
-      const batch = videoIds.slice(i, i + 50);
+    // First get duration from YouTube Data API in batches of 50 (the API
+    // max per call); batches are independent, so a few run at once
+    const batches: string[][] = [];
+    for (let i = 0; i < videoIds.length; i += VIDEOS_PER_BATCH) {
+      batches.push(videoIds.slice(i, i + VIDEOS_PER_BATCH));
+    }
 
+    await mapWithConcurrency(batches, BATCH_CONCURRENCY, async (batch) => {
       try {
         const response = await this.client.get('videos', {
           searchParams: {
             part: 'contentDetails',
             id: batch.join(','),
           },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
+          headers,
         });
 
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -455,21 +700,29 @@ export class YouTubeDataClient {
       } catch (error) {
         logger.warn('Failed to get duration data', { error, batchSize: batch.length });
       }
-    }
+    });
 
     // Then enrich with YouTube Music metadata (album, artists, year, explicit)
-    // Note: YouTube Music API doesn't support batch requests, so we fetch individually
-    if (this.ytMusicClient) {
-      for (const videoId of videoIds) {
+    // YouTube Music API doesn't support batch requests, so tracks are fetched
+    // individually, a bounded number at a time so their round-trips overlap
+    const ytMusicClient = this.ytMusicClient;
+    if (ytMusicClient) {
+      const deadline = performance.now() + ENRICHMENT_BUDGET_MS;
+      let skipped = 0;
+      await mapWithConcurrency(videoIds, ENRICHMENT_CONCURRENCY, async (videoId) => {
+        if (performance.now() > deadline) {
+          skipped++;
+          return;
+        }
         try {
-          const song = await this.ytMusicClient.getSong(videoId);
+          const song = await ytMusicClient.getSong(videoId);
           const existing = enrichedData.get(videoId) || {};
 
           // Get explicit flag by searching (only if title and artist available)
           let explicit: boolean | undefined;
           if (song.title && song.artists && song.artists.length > 0 && song.artists[0]) {
             const artistName = song.artists[0].name;
-            explicit = await this.ytMusicClient.getExplicitFlag(
+            explicit = await ytMusicClient.getExplicitFlag(
               videoId,
               song.title,
               artistName
@@ -487,6 +740,9 @@ export class YouTubeDataClient {
           // YouTube Music API call failed, keep the data we have
           logger.debug('Failed to get YouTube Music metadata', { videoId });
         }
+      });
+      if (skipped > 0) {
+        logger.info('Enrichment budget reached; tracks left unenriched', { skipped, total: videoIds.length });
       }
     }
 
@@ -541,62 +797,38 @@ export class YouTubeDataClient {
    */
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   async getLikedVideos(maxResults: number = 50): Promise<any[]> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const headers = this.requireAuthHeaders();
 
     try {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
       const songs: any[] = [];
-      let pageToken: string | undefined;
-      const perPage = Math.min(maxResults, 50); // API max is 50
-
-      do {
-        // Use YouTube Music's "Liked Music" playlist (ID: LM)
-        // This filters to only music, not all YouTube likes
-        const response = await this.client.get('playlistItems', {
-          searchParams: {
-            part: 'snippet,contentDetails',
-            playlistId: 'LM',
-            maxResults: perPage,
-            ...(pageToken && { pageToken }),
-          },
-          headers: {
-            Authorization: `Bearer ${accessToken}`,
-          },
-        });
-
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-        const data = response.body as any;
-        // eslint-disable-next-line @typescript-eslint/no-explicit-any
-        const pageItems = (data.items || []).map((item: any) => ({
-          videoId: item.contentDetails.videoId,
-          title: item.snippet.title,
-          artist: item.snippet.videoOwnerChannelTitle || item.snippet.channelTitle,
-          thumbnails: item.snippet.thumbnails || {},
-        }));
-
-        songs.push(...pageItems);
-        pageToken = data.nextPageToken;
-
-        // Stop if we have enough results
-        if (songs.length >= maxResults) {
-          break;
+      // Use YouTube Music's "Liked Music" playlist (ID: LM)
+      // This filters to only music, not all YouTube likes
+      const pages = this.paginate(
+        'playlistItems',
+        { part: 'snippet,contentDetails', playlistId: 'LM' },
+        headers,
+        maxResults
+      );
+
+      for await (const page of pages) {
+        for (const item of page.items) {
+          songs.push({
+            videoId: item.contentDetails.videoId,
+            title: item.snippet.title,
+            artist: item.snippet.videoOwnerChannelTitle || item.snippet.channelTitle,
+          });
         }
-      } while (pageToken);
-
-      const finalSongs = songs.slice(0, maxResults);
+      }
 
       // Enrich with video details (duration, etc.)
-      const videoIds = finalSongs.map(s => s.videoId);
+      const videoIds = songs.map(s => s.videoId);
       const enrichedData = await this.enrichVideoData(videoIds);
 
-      return finalSongs.map(song => {
+      return songs.map(song => {
         const enrichment = enrichedData.get(song.videoId);
-        const { thumbnails: _thumbnails, ...songWithoutThumbnails } = song;
         return this.cleanObject({
-          ...songWithoutThumbnails,
+          ...song,
           duration: enrichment ? this.formatDuration(enrichment.durationSeconds) : undefined,
           durationSeconds: enrichment?.durationSeconds,
           album: enrichment?.album,
@@ -618,10 +850,7 @@ export class YouTubeDataClient {
    * Returns null if video doesn't have ISRC (user uploads, covers, etc.)
    */
   async getVideoISRC(videoId: string): Promise<string | null> {
-    const accessToken = this.getAccessToken();
-    if (!accessToken) {
-      throw new Error('No access token available');
-    }
+    const headers = this.requireAuthHeaders();
 
     try {
       logger.debug('Fetching ISRC for video', { videoId });
@@ -631,9 +860,7 @@ export class YouTubeDataClient {
           part: 'contentDetails',
           id: videoId,
         },
-        headers: {
-          Authorization: `Bearer ${accessToken}`,
-        },
+        headers,
       });
 
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -663,6 +890,22 @@ export class YouTubeDataClient {
     }
   }
 
+  /**
+   * Remaining write allowance per operation class for the current user
+   * Null when the session has no token
+   */
+  getRateLimitStats() {
+    const headers = this.currentAuthHeaders();
+    if (!headers) {
+      return null;
+    }
+    const { create, mutate } = this.limitersFor(headers);
+    return {
+      createPlaylist: create.getStats(),
+      mutatePlaylist: mutate.getStats(),
+    };
+  }
+
   async close(): Promise<void> {
     logger.info('YouTube Data API client closed');
   }
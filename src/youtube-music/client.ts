@@ -1,5 +1,8 @@
 import got, { Got } from 'got';
+import { LRUCache } from 'lru-cache';
 import { createLogger } from '../utils/logger.js';
+import { googleAgent } from '../utils/http.js';
+import { RateLimiter } from '../utils/rate-limiter.js';
 import { tokenStore } from '../auth/token-store.js';
 import { config } from '../config.js';
 import type { Song, Album, Artist, Playlist, SearchResponse } from '../types/index.js';
@@ -31,16 +34,46 @@ function getClientVersion(): string {
   return `1.${year}${month}${day}.01.00`;
 }
 
+// Resolved once, so the request context and the client version header
+// always agree (separate calls could straddle midnight)
+const CLIENT_VERSION = getClientVersion();
+
 // Context for YouTube Music InnerTube API requests
 // Match ytmusicapi's minimal context structure exactly
-const YTM_CONTEXT = {
-  client: {
+// Built once and shared by every request body
+const YTM_CONTEXT = Object.freeze({
+  client: Object.freeze({
     clientName: 'WEB_REMIX',
-    clientVersion: getClientVersion(),
-  },
-  user: {},
+    clientVersion: CLIENT_VERSION,
+  }),
+  user: Object.freeze({}),
+});
+
+// Search params per filter, generated from ytmusicapi's get_search_params:
+// param1 = "EgWKAQ" (filtered_param1)
+// param2 = filter-specific (II=songs, IQ=videos, IY=albums, Ig=artists, Io=playlists)
+// param3 = "AWoMEA4QChADEAQQCRAF" (default, not ignoring spelling, no scope)
+const SEARCH_FILTER_PARAMS: Readonly<Record<NonNullable<SearchOptions['filter']>, string>> = {
+  songs: 'EgWKAQIIAWoMEA4QChADEAQQCRAF',
+  videos: 'EgWKAQIQAWoMEA4QChADEAQQCRAF',
+  albums: 'EgWKAQIYAWoMEA4QChADEAQQCRAF',
+  artists: 'EgWKAQIgAWoMEA4QChADEAQQCRAF',
+  playlists: 'Eg-KAQwIABAAGAAgACgBMABqChAEEAMQCRAFEAo%3D',
 };
 
+// Longest a request waits for the shared rate limiter; past this it fails
+// with RateLimitedError, which tools report, instead of stalling the call
+const MAX_RATE_LIMIT_WAIT_MS = 10 * 1000;
+
+// Search results don't depend on the user (InnerTube calls use the public API
+// key), so one cache is shared by every session
+const SEARCH_CACHE_MAX = 4096;
+const SEARCH_CACHE_TTL_MS = 6 * 60 * 60 * 1000;
+// Playlists and albums change (edits, new releases, reissues) far more
+// often than song and artist results, so they expire sooner
+const SEARCH_CACHE_SHORT_TTL_MS = 30 * 60 * 1000;
+const SHORT_TTL_FILTERS: ReadonlySet<string> = new Set(['playlists', 'albums']);
+
 export interface SearchOptions {
   filter?: 'songs' | 'albums' | 'artists' | 'playlists' | 'videos';
   limit?: number;
@@ -48,7 +81,21 @@ export interface SearchOptions {
 
 export class YouTubeMusicClient {
   private client: Got;
+  // Smooths bursts of tool calls instead of letting InnerTube answer with 429s.
+  // The burst bucket holds a full minute's budget so concurrent enrichment
+  // and batch searches run at the configured rate rather than the default
+  // 10-per-10s burst ceiling.
+  private rateLimiter = new RateLimiter('youtube-music', {
+    requestsPerMinute: config.ytMusicRateLimitPerMinute,
+    requestsPerHour: config.ytMusicRateLimitPerHour,
+    burstLimit: config.ytMusicRateLimitPerMinute,
+  });
   private visitorId: string | null = null;
+  private searchCache = new LRUCache<string, SearchResponse>({
+    max: SEARCH_CACHE_MAX,
+    ttl: SEARCH_CACHE_TTL_MS,
+  });
+  private searchesInFlight = new Map<string, Promise<SearchResponse>>();
 
   constructor() {
     this.client = got.extend({
@@ -62,7 +109,7 @@ export class YouTubeMusicClient {
         'Origin': YTM_BASE_URL,
         'Referer': `${YTM_BASE_URL}/`,
         'X-Youtube-Client-Name': '67',
-        'X-Youtube-Client-Version': getClientVersion(),
+        'X-Youtube-Client-Version': CLIENT_VERSION,
       },
       searchParams: {
         // Use API key for InnerTube API (this is how the original working implementation did it)
@@ -70,6 +117,12 @@ export class YouTubeMusicClient {
         prettyPrint: 'false',
       },
       responseType: 'json',
+      // Resolve hosts via cached c-ares lookups instead of getaddrinfo on the
+      // libuv threadpool, which otherwise caps concurrent requests at 4 lookups
+      dnsCache: true,
+      agent: {
+        https: googleAgent,
+      },
       timeout: {
         request: 30000,
       },
@@ -78,6 +131,29 @@ export class YouTubeMusicClient {
     logger.info('YouTube Music InnerTube client initialized');
   }
 
+  /**
+   * Open a pooled connection to YouTube Music ahead of the first tool call,
+   * so that call doesn't pay the TCP + TLS handshake
+   */
+  async warmUp(): Promise<void> {
+    try {
+      await got.head(YTM_BASE_URL, {
+        dnsCache: true,
+        agent: {
+          https: googleAgent,
+        },
+        timeout: {
+          request: 5000,
+        },
+      });
+      logger.debug('YouTube Music connection warmed up');
+    } catch (error) {
+      logger.debug('YouTube Music warm-up failed', {
+        error: error instanceof Error ? error.message : 'Unknown error',
+      });
+    }
+  }
+
   /**
    * Fetch and cache visitor ID from YouTube Music
    * This is required for InnerTube API requests
@@ -150,8 +226,9 @@ export class YouTubeMusicClient {
     body: Record<string, unknown>
   ): Promise<T> {
     // InnerTube API uses API key, not OAuth Bearer tokens
-    // The original working implementation did not use OAuth for these requests
-    const headers: Record<string, string> = {};
+    // The original working implementation did not use OAuth for these requests,
+    // so every header comes from the client defaults
+    await this.rateLimiter.acquire(MAX_RATE_LIMIT_WAIT_MS);
 
     try {
       const response = await this.client.post<T>(endpoint, {
@@ -159,7 +236,6 @@ export class YouTubeMusicClient {
           context: YTM_CONTEXT,
           ...body,
         },
-        headers,
       });
 
       return response.body;
@@ -195,31 +271,46 @@ export class YouTubeMusicClient {
   ): Promise<SearchResponse> {
     const { filter, limit = 20 } = options;
 
-    logger.debug('Searching', { query, filter, limit });
+    const cacheKey = `${filter ?? ''}:${limit}:${query}`;
+    const cached = this.searchCache.get(cacheKey);
+    if (cached !== undefined) {
+      logger.debug('Search cache hit', { query, filter, limit });
+      return cached;
+    }
 
-    // Map filter to YouTube Music params
-    // These params are generated from ytmusicapi's get_search_params function:
-    // param1 = "EgWKAQ" (filtered_param1)
-    // param2 = filter-specific (II=songs, IQ=videos, IY=albums, Ig=artists, Io=playlists)
-    // param3 = "AWoMEA4QChADEAQQCRAF" (default, not ignoring spelling, no scope)
-    const params: Record<string, unknown> = {};
-    if (filter) {
-      const filterMap: Record<string, string> = {
-        songs: 'EgWKAQIIAWoMEA4QChADEAQQCRAF',
-        videos: 'EgWKAQIQAWoMEA4QChADEAQQCRAF',
-        albums: 'EgWKAQIYAWoMEA4QChADEAQQCRAF',
-        artists: 'EgWKAQIgAWoMEA4QChADEAQQCRAF',
-        playlists: 'Eg-KAQwIABAAGAAgACgBMABqChAEEAMQCRAFEAo%3D',
-      };
-      params['params'] = filterMap[filter];
+    // Identical searches issued while one is already running share it
+    let pending = this.searchesInFlight.get(cacheKey);
+    if (pending === undefined) {
+      pending = this.fetchSearch(query, filter, limit, cacheKey).finally(() => {
+        this.searchesInFlight.delete(cacheKey);
+      });
+      this.searchesInFlight.set(cacheKey, pending);
     }
+    return pending;
+  }
+
+  /**
+   * Run a search against InnerTube and cache the parsed result
+   */
+  private async fetchSearch(
+    query: string,
+    filter: SearchOptions['filter'],
+    limit: number,
+    cacheKey: string
+  ): Promise<SearchResponse> {
+    logger.debug('Searching', { query, filter, limit });
 
     const response = await this.makeRequest<unknown>('search', {
       query,
-      ...params,
+      ...(filter && { params: SEARCH_FILTER_PARAMS[filter] }),
+    });
+
+    const result = parseSearchResults(response, filter, limit);
+    this.searchCache.set(cacheKey, result, {
+      ttl: filter && SHORT_TTL_FILTERS.has(filter) ? SEARCH_CACHE_SHORT_TTL_MS : SEARCH_CACHE_TTL_MS,
     });
 
-    return parseSearchResults(response, filter, limit);
+    return result;
   }
 
   // ===========================================================================
@@ -570,6 +661,13 @@ export class YouTubeMusicClient {
   // Utility Methods
   // ===========================================================================
 
+  /**
+   * Remaining InnerTube request allowance
+   */
+  getRateLimitStats() {
+    return this.rateLimiter.getStats();
+  }
+
   /**
    * Close the client and clean up resources
    */